@@ -1,11 +1,14 @@
-from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class RunConfig:
     """
     Configuration for a single critique and refine loop run.
+
+    Instances are immutable; use ``dataclasses.replace`` to derive a variant.
     """
     generator_model: str
     critic_model: str
@@ -16,10 +19,31 @@ class RunConfig:
     stop_threshold: int
     log_file_path: str
     redact_logs: bool
-    full_config: Dict[str, Any]
+    full_config: Mapping[str, Any]
     roles: Dict[str, str]
     default_critic_role_prompt_file: Optional[str] = None
     default_refiner_role_prompt_file: Optional[str] = None
     multi_critic_roles: Optional[List[str]] = None
     disable_meta_critic: bool = False
     dry_run: bool = False
+    # Read-only snapshot; run logs record a copy of it as "config_used".
+    _config_used_snapshot: Mapping[str, Any] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(
+            self,
+            "_config_used_snapshot",
+            MappingProxyType({
+                "generator_model": self.generator_model,
+                "critic_model": self.critic_model,
+                "refiner_model": self.refiner_model,
+                "max_rounds": self.max_rounds,
+                "stop_on_no_actionable_critique_threshold": self.stop_threshold,
+                "default_critic_role_prompt_file": self.default_critic_role_prompt_file,
+                "default_refiner_role_prompt_file": self.default_refiner_role_prompt_file,
+                "multi_critic_roles": (
+                    tuple(self.multi_critic_roles) if self.multi_critic_roles is not None else None
+                ),
+                "disable_meta_critic": self.disable_meta_critic,
+            }),
+        )
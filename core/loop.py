@@ -1,21 +1,94 @@
 import asyncio
 import json
 import logging
+import os
+from collections import OrderedDict
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 import time
 import yaml  # Moved to top of file
 
 # Local imports
 from .model_router import call_model, ModelCallError
 from .roles import load_role_template, TemplateNotFoundError
+from ..utils.config import _YamlLoader
 from ..utils.logger import Logger
 from .config import RunConfig
 
 
+# Parsed strategies.yaml documents keyed by absolute path, validated by (mtime, size).
+_STRATEGY_CACHE: "OrderedDict[str, Tuple[float, int, Dict[str, Any]]]" = OrderedDict()
+_STRATEGY_CACHE_MAX_ENTRIES = 16
+
+
+def _load_strategies_file(path: str) -> Dict[str, Any]:
+    """Loads and caches a parsed strategies file, re-parsing only when it changes on disk."""
+    abs_path = os.path.abspath(path)
+    st = os.stat(abs_path)
+    cached = _STRATEGY_CACHE.get(abs_path)
+    if cached is not None and cached[0] == st.st_mtime and cached[1] == st.st_size:
+        _STRATEGY_CACHE.move_to_end(abs_path)
+        return cached[2]
+
+    with open(abs_path, "r", encoding="utf-8") as f:
+        data = yaml.load(f, Loader=_YamlLoader) or {}
+    _STRATEGY_CACHE[abs_path] = (st.st_mtime, st.st_size, data)
+    _STRATEGY_CACHE.move_to_end(abs_path)
+    while len(_STRATEGY_CACHE) > _STRATEGY_CACHE_MAX_ENTRIES:
+        _STRATEGY_CACHE.popitem(last=False)
+    return data
+
+
+@dataclass(frozen=True, slots=True)
+class _StrategySpec:
+    """A strategy from strategies.yaml, normalized once so the loop never re-inspects the raw YAML."""
+    roles: Tuple[str, ...]
+    has_brainstormer: bool
+    brainstormer_rounds: int
+
+    @classmethod
+    def from_config(cls, strategy_config: Any) -> Optional["_StrategySpec"]:
+        """Builds a spec from a strategy entry, which is either a list of roles or a dict."""
+        if not strategy_config:
+            return None
+        if isinstance(strategy_config, list):
+            role_names = strategy_config
+            brainstormer_rounds = 1
+        elif isinstance(strategy_config, dict):
+            role_names = strategy_config.get("roles", [])
+            brainstormer_rounds = strategy_config.get("max_rounds", 1)
+        else:
+            role_names = []
+            brainstormer_rounds = 1
+        return cls(
+            roles=tuple(f"{role}.txt" for role in role_names),
+            has_brainstormer="brainstormer" in role_names,
+            brainstormer_rounds=brainstormer_rounds,
+        )
+
+
 class CritiqueRefineLoop:
     """Encapsulates the critique and refinement loop logic."""
 
+    # Structured-output settings that restrict the meta-critic to a small JSON verdict.
+    _META_CRITIC_RESPONSE_CONFIG: Dict[str, Any] = {
+        "response_mime_type": "application/json",
+        "response_schema": {
+            "type": "object",
+            "properties": {"actionable": {"type": "boolean"}},
+            "required": ["actionable"],
+        },
+    }
+
+    # Static fragments of the refiner prompt, joined around the text and critique.
+    _REFINE_TMPL = (
+        "Original text:\n",
+        "\n\nCritique:\n",
+        "\n\nRefine the original text based on the critique.",
+    )
+    _CRITIQUE_SEPARATOR = "\n\n"
+
     def __init__(self, run_config: RunConfig, strategy: Optional[str] = None):
         """Initializes the loop with a run configuration.
 
@@ -43,7 +116,14 @@ class CritiqueRefineLoop:
         self.meta_critic_template = self.run_config.roles.get("meta_critic_template")
         self.full_config = self.run_config.full_config
         self.dry_run = self.run_config.dry_run
+        self.max_concurrent_calls = self.full_config.get("critique_refine_config", {}).get(
+            "max_concurrent_calls", 4
+        )
+        self._call_semaphore = asyncio.Semaphore(self.max_concurrent_calls)
         self.strategy = self._load_strategy(strategy)
+        self._critic_roles = self._resolve_critic_roles()
+        # Role templates read by _preload_templates, keyed by file name.
+        self._templates: Dict[str, str] = {}
         self.run_log: Dict[str, Any] = {
             "timestamp": datetime.now().isoformat(),
             "original_user_prompt": None,
@@ -53,17 +133,8 @@ class CritiqueRefineLoop:
             "refinements": [],
             "reason_for_stopping": "",
             "final_output": "",
-            "config_used": {
-                "generator_model": self.generator_model,
-                "critic_model": self.critic_model,
-                "refiner_model": self.refiner_model,
-                "max_rounds": self.max_rounds,
-                "stop_on_no_actionable_critique_threshold": self.stop_threshold,
-                "default_critic_role_prompt_file": self.default_critic_role_prompt_file,
-                "default_refiner_role_prompt_file": self.default_refiner_role_prompt_file,
-                "multi_critic_roles": self.multi_critic_roles,
-                "disable_meta_critic": self.disable_meta_critic,
-            },
+            # A copy, so callers mutating the returned log cannot alter the RunConfig.
+            "config_used": dict(self.run_config._config_used_snapshot),
         }
 
     async def _generate(
@@ -71,102 +142,111 @@ class CritiqueRefineLoop:
     ) -> Tuple[str, Dict[str, Any]]:
         """Generates initial content; uses provided content or calls the generator model."""
         logging.info("Entering generation phase...")
-        initial_response = initial_content_for_review or await call_model(
-            prompt=f"User prompt: {initial_user_prompt}",
-            model_name=self.generator_model,
-            config=self.full_config,
-            dry_run=self.dry_run,
-            role="generator",
-        )
+        if initial_content_for_review is not None:
+            initial_response = initial_content_for_review
+            model_used = "N/A (provided content for review)"
+        else:
+            initial_response = await call_model(
+                prompt=f"User prompt: {initial_user_prompt}",
+                model_name=self.generator_model,
+                config=self.full_config,
+                dry_run=self.dry_run,
+                role="generator",
+            )
+            model_used = self.generator_model
         initial_generation_log = {
             "text": initial_response,
-            "model_used": self.generator_model if initial_content_for_review is None else "N/A (provided content for review)",
+            "model_used": model_used,
         }
-        logging.info(f"[{datetime.now().isoformat()}]\n--- Initial Response ---\n%s\n", initial_response)
+        logging.info("\n--- Initial Response ---\n%s\n", initial_response)
         return initial_response, initial_generation_log
 
     async def _get_critique(self, current_text: str, role_file: str) -> str:
         """Helper function to get critique from a single role."""
         try:
-            role_template = load_role_template(role_file)
-            critique = await call_model(
-                prompt=current_text,
-                model_name=self.critic_model,
-                system_prompt=role_template,
-                config=self.full_config,
-                dry_run=self.dry_run,
-                role="critic",
-            )
+            role_template = self._role_template(role_file)
+            # Bound concurrent critic calls so large multi-critic strategies don't trip rate limits.
+            async with self._call_semaphore:
+                critique = await call_model(
+                    prompt=current_text,
+                    model_name=self.critic_model,
+                    system_prompt=role_template,
+                    config=self.full_config,
+                    dry_run=self.dry_run,
+                    role="critic",
+                )
             return critique
         except ModelCallError as e:
-            logging.error(f"[{datetime.now().isoformat()}] ModelCallError generating critique from {role_file}: {e}", exc_info=True)
+            logging.error("ModelCallError generating critique from %s: %s", role_file, e, exc_info=True)
             raise
         except Exception as e:
-            logging.exception(f"[{datetime.now().isoformat()}] Unexpected error generating critique from {role_file}: {e}")
+            logging.exception("Unexpected error generating critique from %s: %s", role_file, e)
             raise
 
-    def _load_strategy(self, strategy_name: Optional[str]) -> Optional[Dict[str, Any]]:
-        """Loads a strategy from the strategies.yaml file."""
+    def _load_strategy(self, strategy_name: Optional[str]) -> Optional[_StrategySpec]:
+        """Loads a strategy from the strategies.yaml file and normalizes it into a _StrategySpec."""
         if not strategy_name:
             return None
         try:
-            with open("strategies.yaml", "r", encoding="utf-8") as f:
-                data = yaml.safe_load(f)
-                return data.get("strategies", {}).get(strategy_name)
+            data = _load_strategies_file("strategies.yaml")
+            return _StrategySpec.from_config(data.get("strategies", {}).get(strategy_name))
         except (FileNotFoundError, yaml.YAMLError) as e:
-            logging.error(f"Could not load or parse strategies.yaml: {e}")
+            logging.error("Could not load or parse strategies.yaml: %s", e)
             return None
 
+    def _resolve_critic_roles(self) -> Tuple[str, ...]:
+        """Resolves the critic role files once, failing fast if none are configured."""
+        if self.strategy:
+            return self.strategy.roles
+        if self.multi_critic_roles:
+            return tuple(self.multi_critic_roles)
+        if self.default_critic_role_prompt_file:
+            return (self.default_critic_role_prompt_file,)
+        raise ValueError("No critic role specified in the configuration.")
+
     async def _critique(
         self, current_text: str, round_num: int
-    ) -> Tuple[str, Dict[str, Any]]:
-        """Generates a critique; handles single and multi-critic roles."""
-        logging.info(f"[{datetime.now().isoformat()}] Entering critique phase (Round {round_num})...")
+    ) -> Tuple[List[str], Dict[str, Any]]:
+        """Generates critiques; handles single and multi-critic roles.
+
+        Returns the individual critiques and the round's log entry, whose "text"
+        field holds the critiques joined for display and meta-critique.
+        """
+        logging.debug("Entering critique phase (Round %d)...", round_num)
         critique_log = {"round": round_num, "model_used": self.critic_model}
 
         try:
-            roles_to_use = []
-            if self.strategy:
-                if isinstance(self.strategy, list):
-                    roles_to_use = [f"{role}.txt" for role in self.strategy]
-                elif isinstance(self.strategy, dict) and "roles" in self.strategy:
-                    roles_to_use = [f"{role}.txt" for role in self.strategy["roles"]]
-            elif self.multi_critic_roles:
-                roles_to_use = self.multi_critic_roles
-            elif self.default_critic_role_prompt_file:
-                roles_to_use = [self.default_critic_role_prompt_file]
-            else:
-                raise ValueError("No critic role specified in the configuration.")
-
-            logging.debug(f"[_critique] roles_to_use: {roles_to_use}")
-            logging.info(
-                f"[{datetime.now().isoformat()}] --- Multi-agent Critique (Roles: %s) ---",
-                ", ".join(roles_to_use),
-            )
+            roles_to_use = list(self._critic_roles)
+            logging.debug("[_critique] roles_to_use: %s", roles_to_use)
             critiques = await asyncio.gather(
                 *[self._get_critique(current_text, role_file) for role_file in roles_to_use]
             )
-            logging.debug(f"[_critique] critiques from asyncio.gather: {critiques}")
-            critique = "\n\n".join(critiques)
+            logging.debug("[_critique] critiques: %s", critiques)
+            critique = self._CRITIQUE_SEPARATOR.join(critiques)
             critique_log["role_prompt_file_used"] = roles_to_use
             critique_log["text"] = critique
-            logging.info(f"[{datetime.now().isoformat()}]\n--- Critique ---\n%s\n", critique)
-            return critique, critique_log
+            return list(critiques), critique_log
         except asyncio.TimeoutError:
-            logging.error(f"[{datetime.now().isoformat()}] Critique generation timed out.")
+            logging.error("Critique generation timed out.")
             raise
         except Exception as e:
-            logging.exception(f"[{datetime.now().isoformat()}] Unexpected error during critique phase: {e}")
+            logging.exception("Unexpected error during critique phase: %s", e)
             raise
 
     async def _refine(
-        self, current_text: str, critique: str, round_num: int
+        self, current_text: str, critiques: List[str], round_num: int
     ) -> Tuple[str, Dict[str, Any]]:
-        """Refines the text based on the critique."""
-        logging.info(f"[{datetime.now().isoformat()}] Entering refinement phase (Round {round_num})...")
-        refine_prompt_for_model = (
-            f"Original text:\n{current_text}\n\nCritique:\n{critique}\n\nRefine the original text based on the critique."
-        )
+        """Refines the text based on the critiques."""
+        logging.debug("Entering refinement phase (Round %d)...", round_num)
+        # Assemble the prompt in one pass from the individual critiques instead of
+        # embedding a separately joined critique string.
+        fragments = [self._REFINE_TMPL[0], current_text, self._REFINE_TMPL[1]]
+        for index, critique in enumerate(critiques):
+            if index:
+                fragments.append(self._CRITIQUE_SEPARATOR)
+            fragments.append(critique)
+        fragments.append(self._REFINE_TMPL[2])
+        refine_prompt_for_model = "".join(fragments)
         refined_response = await call_model(
             prompt=refine_prompt_for_model,
             model_name=self.refiner_model,
@@ -181,29 +261,82 @@ class CritiqueRefineLoop:
             "model_used": self.refiner_model,
             "role_prompt_file_used": self.default_refiner_role_prompt_file,
         }
-        logging.info(f"[{datetime.now().isoformat()}]\n--- Refined Response ---\n%s\n", refined_response)
         return refined_response, refinement_log
 
+    @staticmethod
+    async def _discard_task(task: "asyncio.Task[Any]") -> None:
+        """Cancels a speculative task and waits for it, ignoring its outcome.
+
+        Only the child's cancellation is suppressed; if the calling task is
+        itself being cancelled, the CancelledError propagates.
+        """
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            current = asyncio.current_task()
+            if current is not None and current.cancelling():
+                raise
+        except Exception as e:  # pylint: disable=broad-except
+            logging.debug("Discarded speculative task failed: %s", e)
+
+    @staticmethod
+    def _log_round(
+        round_num: int, critique_log: Dict[str, Any], refined_response: Optional[str]
+    ) -> None:
+        """Emits a single record summarizing a completed round.
+
+        The structured round data is attached as ``record.round_record`` for
+        handlers that serialize records instead of formatting the message.
+        """
+        if not logging.getLogger().isEnabledFor(logging.INFO):
+            return
+        round_record = {
+            "round": round_num,
+            "roles": critique_log.get("role_prompt_file_used"),
+            "critique": critique_log.get("text"),
+            "refined": refined_response,
+        }
+        logging.info(
+            "\n--- Round %d (Roles: %s) ---\nCritique:\n%s\n\nRefined Response:\n%s\n",
+            round_num,
+            ", ".join(round_record["roles"] or []),
+            round_record["critique"],
+            refined_response if refined_response is not None else "(skipped: critique not actionable)",
+            extra={"round_record": round_record},
+        )
+
     async def _run_critique_refine_loop(self, initial_text: str) -> str:
         """Runs the iterative critique and refine loop."""
         current_text = initial_text
         for i in range(self.max_rounds):
             try:
-                critique_text, critique_log = await self._critique(current_text, i + 1)
+                critiques, critique_log = await self._critique(current_text, i + 1)
                 self.run_log["critiques"].append(critique_log)
+                critique_text = critique_log["text"]
 
+                # Start refining speculatively so the meta-critic round trip overlaps
+                # with the refiner call; the refinement is discarded if not actionable.
+                refine_task = asyncio.create_task(
+                    self._refine(current_text, critiques, i + 1)
+                )
                 if not self.disable_meta_critic:
-                    actionability = await self._is_critique_actionable(critique_text)
+                    try:
+                        actionability = await self._is_critique_actionable(critique_text)
+                    except BaseException:
+                        await self._discard_task(refine_task)
+                        raise
                     if not actionability:
+                        await self._discard_task(refine_task)
+                        self._log_round(i + 1, critique_log, None)
                         self.run_log["reason_for_stopping"] = (
                             f"Non-actionable critique received in round {i + 1}."
                         )
                         return current_text
 
-                refined_response, refinement_log = await self._refine(
-                    current_text, critique_text, i + 1
-                )
+                refined_response, refinement_log = await refine_task
                 self.run_log["refinements"].append(refinement_log)
+                self._log_round(i + 1, critique_log, refined_response)
                 current_text = refined_response
             except asyncio.TimeoutError:
                 self.run_log["reason_for_stopping"] = f"Timeout in round {i + 1}"
@@ -220,31 +353,33 @@ class CritiqueRefineLoop:
     async def _get_meta_critique(self, critique_text: str) -> Dict[str, Any]:
         """Gets meta-critique from the model."""
         if not self.meta_critic_template:
-            logging.warning(f"[{datetime.now().isoformat()}] Meta-critic template not found. Assuming critique is actionable.")
+            logging.warning("Meta-critic template not found. Assuming critique is actionable.")
             return {"actionable": True}
         try:
             response = await call_model(
                 prompt=critique_text,
                 model_name=self.run_config.meta_critic_model,
                 system_prompt=self.meta_critic_template,
-                config=self.full_config,
+                config={**self.full_config, **self._META_CRITIC_RESPONSE_CONFIG},
                 dry_run=self.dry_run,
                 role="meta_critic",
             )
             if isinstance(response, str):
+                # The model is constrained to the JSON schema above; anything else
+                # (e.g. dry-run or mock responses) is treated as non-actionable.
                 try:
-                    return json.loads(response)
+                    response = json.loads(response)
                 except json.JSONDecodeError:
-                    # Handle cases where the string is not valid JSON
-                    return {"actionable": "ACTIONABLE" in response}
+                    logging.warning("Meta-critic returned non-JSON output; treating critique as non-actionable.")
+                    return {"actionable": False}
             if not isinstance(response, dict):
                 raise ValueError(f"Unexpected response type from meta-critic model: {type(response)}")
             return response
         except (ModelCallError, ValueError) as e:
-            logging.error(f"[{datetime.now().isoformat()}] Error during meta-critique: {e}", exc_info=True)
+            logging.error("Error during meta-critique: %s", e, exc_info=True)
             return {"actionable": False}
         except Exception as e:
-            logging.exception(f"[{datetime.now().isoformat()}] Unexpected error during meta-critique: {e}")
+            logging.exception("Unexpected error during meta-critique: %s", e)
             return {"actionable": False}
 
     async def _is_critique_actionable(self, critique_text: str) -> bool:
@@ -255,21 +390,12 @@ class CritiqueRefineLoop:
     async def _run_brainstormer_loop(self, initial_text: str) -> str:
         """Runs the brainstormer loop for a specified number of rounds."""
         current_text = initial_text
-        logging.debug(f"[_run_brainstormer_loop] self.strategy: {self.strategy}")
-        if self.strategy and (
-            (isinstance(self.strategy, list) and "brainstormer" in self.strategy)
-            or (
-                isinstance(self.strategy, dict)
-                and "brainstormer" in self.strategy.get("roles", [])
-            )
-        ):
+        logging.debug("[_run_brainstormer_loop] self.strategy: %s", self.strategy)
+        if self.strategy and self.strategy.has_brainstormer:
             logging.debug("[_run_brainstormer_loop] Strategy condition met.")
-            brainstormer_rounds = 1
-            if isinstance(self.strategy, dict):
-                brainstormer_rounds = self.strategy.get("max_rounds", 1)
-            for i in range(brainstormer_rounds):
-                logging.info(f"Entering brainstormer phase (Round {i + 1})...")
-                brainstormer_template = load_role_template("brainstormer.txt")
+            for i in range(self.strategy.brainstormer_rounds):
+                logging.info("Entering brainstormer phase (Round %d)...", i + 1)
+                brainstormer_template = self._role_template("brainstormer.txt")
                 current_text = await call_model(
                     prompt=current_text,
                     model_name=self.generator_model,
@@ -278,12 +404,34 @@ class CritiqueRefineLoop:
                     dry_run=self.dry_run,
                     role="brainstormer",
                 )
-                logging.info(f"--- Brainstormer Response ---\n{current_text}\n")
-                logging.debug(f"[_run_brainstormer_loop] current_text after call_model: {current_text}")
+                logging.info("--- Brainstormer Response ---\n%s\n", current_text)
+                logging.debug("[_run_brainstormer_loop] current_text after call_model: %s", current_text)
             return current_text
         logging.debug("[_run_brainstormer_loop] Strategy condition NOT met. Returning initial_text.")
         return initial_text
 
+    async def _preload_templates(self) -> None:
+        """Reads every role template the run will need in worker threads.
+
+        The texts are kept in ``self._templates`` so later lookups do no I/O on
+        the event loop. The refiner and meta-critic templates are already loaded
+        into ``run_config.roles``.
+        """
+        file_names = list(dict.fromkeys(self._critic_roles))
+        if self.strategy and self.strategy.has_brainstormer and "brainstormer.txt" not in file_names:
+            file_names.append("brainstormer.txt")
+        texts = await asyncio.gather(
+            *(asyncio.to_thread(load_role_template, file_name) for file_name in file_names)
+        )
+        self._templates = dict(zip(file_names, texts))
+
+    def _role_template(self, file_name: str) -> str:
+        """Returns a preloaded role template, loading it only if it was not preloaded."""
+        template = self._templates.get(file_name)
+        if template is None:
+            template = load_role_template(file_name)
+        return template
+
     async def run(
         self,
         initial_user_prompt: str,
@@ -294,6 +442,8 @@ class CritiqueRefineLoop:
         start_time = time.time()
 
         try:
+            await self._preload_templates()
+
             initial_text, initial_generation_log = await self._generate(
                 initial_user_prompt, initial_content_for_review
             )
@@ -311,18 +461,18 @@ class CritiqueRefineLoop:
             self.run_log["runtime"] = time.time() - start_time
 
         except (TemplateNotFoundError, asyncio.TimeoutError) as e:
-            logging.error(f"[{datetime.now().isoformat()}] Error during loop execution: {e}", exc_info=True)
+            logging.error("Error during loop execution: %s", e, exc_info=True)
             self.run_log["reason_for_stopping"] = f"Error: {e}"
             self.run_log["final_output"] = ""
-            self.logger.log_run(self.run_log)
             raise
         except Exception as e:
             error_message = f"[{datetime.now().isoformat()}] Error during critique/refine loop: {e}"
-            logging.exception(error_message)
+            logging.exception("Error during critique/refine loop: %s", e)
             self.run_log["reason_for_stopping"] = error_message
             self.run_log["final_output"] = ""
             raise
         finally:
-            self.logger.log_run(self.run_log)
+            # Serialize and write the log off the event loop thread.
+            await asyncio.to_thread(self.logger.log_run, self.run_log)
 
         return self.run_log["final_output"], self.run_log
@@ -1,6 +1,8 @@
 """Model router for the critique and refine tool."""
+import functools
+import json
 import logging
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Mapping, Optional, Tuple
 
 import google.generativeai as genai
 from google.generativeai.types import HarmCategory, HarmBlockThreshold
@@ -24,16 +26,33 @@ class ModelCallError(Exception):
 
 # --- Initialization ---
 _is_initialized = False
+_configured_api_key: Optional[str] = None
+
+# GenerativeModel instances reused across calls, keyed by (model_name, system_prompt).
+_MODEL_CACHE: Dict[Tuple[str, Optional[str]], "genai.GenerativeModel"] = {}
 
 
 def initialize(api_key: str):
-    """Initializes the Google Generative AI client."""
-    global _is_initialized
+    """Initializes the Google Generative AI client.
+
+    The SDK keeps one process-wide client (and its HTTP/2 or gRPC channel) that
+    every GenerativeModel shares. Re-running ``genai.configure`` discards that
+    client, so repeated initialization with the same key is a no-op.
+    """
+    global _is_initialized, _configured_api_key, call_gemini
     if not api_key:
         raise ModelAPIError("Google Gemini API key is required for initialization.")
+    if _is_initialized and api_key == _configured_api_key:
+        logging.debug("Google Generative AI client already initialized; reusing it.")
+        return
     try:
         genai.configure(api_key=api_key)
+        # Models built under a previous configuration must not be reused.
+        _MODEL_CACHE.clear()
         _is_initialized = True
+        _configured_api_key = api_key
+        # Swap in the real implementation so calls skip the initialization check.
+        call_gemini = _call_gemini_impl
         logging.info("Google Generative AI client initialized successfully.")
     except Exception as e:
         raise ModelAPIError(f"Failed to configure Google Generative AI client: {e}") from e
@@ -50,11 +69,73 @@ def list_available_models() -> List[str]:
         return []
 
 
+_GENERATION_CONFIG_KEYS = (
+    "temperature",
+    "max_output_tokens",
+    "top_k",
+    "top_p",
+    "response_mime_type",
+)
+
+
+def _generation_config_key(config: Dict[str, Any]) -> Tuple[Any, ...]:
+    """Reduce a config dictionary to the hashable values that shape generation settings."""
+    gen_params = tuple((key, config[key]) for key in _GENERATION_CONFIG_KEYS if key in config)
+    if "response_schema" in config:
+        # Schemas are nested dicts; encode them canonically so they can be part of the key.
+        gen_params += (("response_schema", json.dumps(config["response_schema"], sort_keys=True)),)
+    safety = config.get("safety_settings")
+    safety_params: Tuple[Tuple[Any, Any], ...] = ()
+    if isinstance(safety, list):
+        safety_params = tuple(
+            (setting["category"], setting["threshold"])
+            for setting in safety
+            if isinstance(setting, dict) and "category" in setting and "threshold" in setting
+        )
+    return gen_params, safety_params
+
+
+@functools.lru_cache(maxsize=32)
+def _build_generation_config(key: Tuple[Any, ...]) -> Dict[str, Any]:
+    """Build GenerationConfig and SafetySettings once per distinct set of settings."""
+    gen_params, safety_params = key
+
+    # Generation Config
+    gen_config_params = dict(gen_params)
+    if "response_schema" in gen_config_params:
+        gen_config_params["response_schema"] = json.loads(gen_config_params["response_schema"])
+    generation_config_obj = genai.GenerationConfig(**gen_config_params) if gen_config_params else None
+
+    # Safety Settings
+    safety_settings_list = []
+    for category, threshold in safety_params:
+        try:
+            category_enum = HarmCategory[category]
+            threshold_enum = HarmBlockThreshold[threshold]
+            safety_settings_list.append(
+                {"category": category_enum, "threshold": threshold_enum}
+            )
+        except (KeyError, AttributeError, TypeError) as e:
+            logging.warning(
+                "Invalid safety setting '%s': %s. Skipping.",
+                {"category": category, "threshold": threshold},
+                e,
+            )
+
+    return {
+        "generation_config": generation_config_obj,
+        "safety_settings": safety_settings_list if safety_settings_list else None,
+    }
+
+
 def _create_generation_config(
     config: Optional[Dict[str, Any]]
 ) -> Dict[str, Any]:
     """Create GenerationConfig and SafetySettings from a config dictionary.
 
+    The SDK objects are built once per distinct combination of settings and
+    reused across calls, since they are derived from static configuration.
+
     Args:
         config: A dictionary containing model configuration parameters.
 
@@ -62,39 +143,20 @@ def _create_generation_config(
         A dictionary with 'generation_config' and 'safety_settings' objects.
     """
     # Default to an empty dictionary if config is None
-    config = config or {}
+    return _build_generation_config(_generation_config_key(config or {}))
 
-    # Generation Config
-    gen_config_params = {
-        key: config[key]
-        for key in ["temperature", "max_output_tokens", "top_k", "top_p"]
-        if key in config
-    }
-    generation_config_obj = genai.GenerationConfig(**gen_config_params) if gen_config_params else None
-
-    # Safety Settings
-    safety_settings_list = []
-    if "safety_settings" in config and isinstance(config["safety_settings"], list):
-        for setting in config["safety_settings"]:
-            if isinstance(setting, dict) and "category" in setting and "threshold" in setting:
-                try:
-                    category_enum = HarmCategory[setting["category"]]
-                    threshold_enum = HarmBlockThreshold[setting["threshold"]]
-                    safety_settings_list.append(
-                        {"category": category_enum, "threshold": threshold_enum}
-                    )
-                except (KeyError, AttributeError) as e:
-                    logging.warning(
-                        "Invalid safety setting '%s': %s. Skipping.", setting, e
-                    )
 
-    return {
-        "generation_config": generation_config_obj,
-        "safety_settings": safety_settings_list if safety_settings_list else None,
-    }
+async def _call_gemini_uninitialized(
+    prompt: str,
+    model_name: str,
+    system_prompt: Optional[str] = None,
+    config: Optional[Dict[str, Any]] = None,
+) -> str:
+    """Stand-in for call_gemini until initialize() has configured the client."""
+    raise ModelAPIError("Model router has not been initialized. Call initialize() first.")
 
 
-async def call_gemini(
+async def _call_gemini_impl(
     prompt: str,
     model_name: str,
     system_prompt: Optional[str] = None,
@@ -112,17 +174,20 @@ async def call_gemini(
         The model's generated text response.
 
     Raises:
-        ModelAPIError: If the API call fails or the router is not initialized.
+        ModelAPIError: If the API call fails.
     """
-    if not _is_initialized:
-        raise ModelAPIError("Model router has not been initialized. Call initialize() first.")
-        
     try:
         model_kwargs = _create_generation_config(config)
-        model = genai.GenerativeModel(
-            model_name=model_name,
-            system_instruction=system_prompt,
-        )
+        key = (model_name, system_prompt)
+        model = _MODEL_CACHE.get(key)
+        if model is None:
+            model = _MODEL_CACHE.setdefault(
+                key,
+                genai.GenerativeModel(
+                    model_name=model_name,
+                    system_instruction=system_prompt,
+                ),
+            )
         response = await model.generate_content_async(
             contents=[{"text": prompt}],
             generation_config=model_kwargs["generation_config"],
@@ -141,11 +206,27 @@ async def call_gemini(
         raise ModelAPIError(f"An unexpected error occurred with model {model_name}") from e
 
 
+# Rebound to _call_gemini_impl by initialize(); call through the module attribute.
+call_gemini = _call_gemini_uninitialized
+
+
+@functools.lru_cache(maxsize=128)
+def _dry_run_response(model_name: str) -> str:
+    """Return the canned dry-run response for a model."""
+    return f"DRY_RUN_RESPONSE: This is a mocked response for model {model_name}."
+
+
+@functools.lru_cache(maxsize=128)
+def _mock_response(model_name: str) -> str:
+    """Return the canned response for a mock model."""
+    return f"MOCK_RESPONSE: This is a mocked response for model {model_name}."
+
+
 async def call_model(
     prompt: str,
     model_name: Optional[str] = None,
     system_prompt: Optional[str] = None,
-    config: Optional[Dict[str, Any]] = None,
+    config: Optional[Mapping[str, Any]] = None,
     dry_run: bool = False,
     role: Optional[str] = None,
 ) -> str:
@@ -200,11 +281,11 @@ async def call_model(
     # 3. Handle Dry Run
     if dry_run:
         logging.info("Dry run: Skipping actual model call to %s.", model_to_use)
-        return f"DRY_RUN_RESPONSE: This is a mocked response for model {model_to_use}."
+        return _dry_run_response(model_to_use)
 
     # 4. Handle Mock Models for testing
     if model_to_use.startswith("mock"):
-        return f"MOCK_RESPONSE: This is a mocked response for model {model_to_use}."
+        return _mock_response(model_to_use)
 
     # 5. Primary Model Call
     try:
@@ -1,16 +1,28 @@
+import os
+import threading
+from collections import OrderedDict
 from pathlib import Path
-from typing import Optional
-import functools
+from typing import Optional, Tuple
 
 
 class TemplateNotFoundError(Exception):
     """Custom exception for when a template file is not found."""
 
 
+# Template contents keyed by resolved path, validated by (mtime, size) so edits are picked up.
+_TEMPLATE_CACHE: "OrderedDict[Path, Tuple[float, int, str]]" = OrderedDict()
+_TEMPLATE_CACHE_MAX_ENTRIES = 64
+# Templates are loaded from worker threads (asyncio.to_thread), so cache updates are serialized.
+_TEMPLATE_CACHE_LOCK = threading.Lock()
+
+
 def load_role_template(file_name: str, base_dir: Optional[Path] = None) -> str:
     """
     Loads a role template from the 'prompts' directory.
 
+    Results are cached per file and re-read only when the file's modification
+    time or size changes.
+
     Args:
         file_name: The name of the role template file (e.g., "critic.txt").
         base_dir: Optional. The base directory to search for the 'prompts' folder.
@@ -28,15 +40,31 @@ def load_role_template(file_name: str, base_dir: Optional[Path] = None) -> str:
         # So we go up one level to the 'critique_refine' directory, then into 'prompts'.
         base_dir = Path(__file__).parent.parent / "prompts"
 
-    file_path = base_dir / file_name
+    file_path = (Path(base_dir) / file_name).resolve()
     try:
+        st = os.stat(file_path)
+        with _TEMPLATE_CACHE_LOCK:
+            cached = _TEMPLATE_CACHE.get(file_path)
+            if cached is not None and cached[0] == st.st_mtime and cached[1] == st.st_size:
+                _TEMPLATE_CACHE.move_to_end(file_path)
+                return cached[2]
+
         with open(file_path, "r", encoding="utf-8") as f:
-            return f.read()
+            content = f.read()
     except FileNotFoundError as e:
         raise TemplateNotFoundError(f"Prompt template not found at {file_path}") from e
     except OSError as e:
         raise IOError(f"Error loading prompt template from {file_path}: {e}") from e
 
+    with _TEMPLATE_CACHE_LOCK:
+        _TEMPLATE_CACHE[file_path] = (st.st_mtime, st.st_size, content)
+        _TEMPLATE_CACHE.move_to_end(file_path)
+        while len(_TEMPLATE_CACHE) > _TEMPLATE_CACHE_MAX_ENTRIES:
+            _TEMPLATE_CACHE.popitem(last=False)
+    return content
+
 
-# Apply LRU cache to the function
-load_role_template = functools.lru_cache(maxsize=None)(load_role_template)
\ No newline at end of file
+def clear_template_cache() -> None:
+    """Drop all cached role templates so the next load re-reads from disk."""
+    with _TEMPLATE_CACHE_LOCK:
+        _TEMPLATE_CACHE.clear()
@@ -1,27 +1,73 @@
 import asyncio
-import json
+import dataclasses
+import heapq
 import os
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Mapping, Optional, Tuple
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path # Keep only one Path import
 
-from core.model_router import call_model # Added call_model import
-from core.roles import load_role_template # Added load_role_template import
+from .model_router import call_model
+from .roles import load_role_template
 
-from core.loop import CritiqueRefineLoop
-from utils.config import (
+from .loop import CritiqueRefineLoop
+from ..utils.config import (
     get_project_context_path,
     build_run_config,
     get_logging_config,
 )
-from utils.review_analyzer import ReviewAnalyzer  # Added import for ReviewAnalyzer
+from ..utils.jsonio import _dump_json
+from ..utils.review_analyzer import ReviewAnalyzer
+
+
+def _summarize_run_log(run_log: Dict[str, Any]) -> Dict[str, Any]:
+    """Reduce a run log to the fields the self-improvement critic needs.
+
+    The full texts are already part of the prompt or irrelevant to tuning the
+    tool, so only the outcome, round count and per-round sizes are kept.
+    """
+    critiques = run_log.get("critiques", [])
+    refinements = run_log.get("refinements", [])
+    return {
+        "reason_for_stopping": run_log.get("reason_for_stopping"),
+        "rounds": len(critiques),
+        "critique_lengths": [len(c.get("text") or "") for c in critiques],
+        "refinement_lengths": [len(r.get("text") or "") for r in refinements],
+        "final_output_length": len(run_log.get("final_output") or ""),
+        "runtime": run_log.get("runtime"),
+        "config_used": run_log.get("config_used"),
+    }
+
+
+def _truncate(text: str, max_chars: int) -> str:
+    """Truncate text to max_chars, noting how much was cut."""
+    if len(text) <= max_chars:
+        return text
+    return f"{text[:max_chars]}\n[... truncated {len(text) - max_chars} characters ...]"
+
+
+def _read_review_file(review_file: Path) -> Optional[str]:
+    """Read a review file, returning None if it cannot be read."""
+    try:
+        return review_file.read_text(encoding="utf-8")
+    except IOError as e:
+        logging.warning("Could not read review file %s: %s", review_file, e)
+        return None
+
+
+def _read_texts(paths: List[Path]) -> List[Optional[str]]:
+    """Read several files with their reads in flight together, preserving order."""
+    if len(paths) <= 1:
+        return [_read_review_file(path) for path in paths]
+    with ThreadPoolExecutor(max_workers=len(paths)) as executor:
+        return list(executor.map(_read_review_file, paths))
 
 
 class SelfReviewTool:
     """A tool for self-reviewing code using a critique-refine loop."""
 
-    def __init__(self, full_config: Dict[str, Any], output_dir: Optional[Path] = None):
+    def __init__(self, full_config: Mapping[str, Any], output_dir: Optional[Path] = None):
         """Initialize the SelfReviewTool.
 
         Args:
@@ -30,12 +76,44 @@ class SelfReviewTool:
         """
         self.full_config = full_config
         self.logging_config = get_logging_config()
+        # Resolve per-run settings once instead of on every file.
+        self_review_config = full_config.get("self_review_config", {})
+        self._default_critic_role = self_review_config.get("default_critic_role")
+        self._default_refiner_role = self_review_config.get("default_refiner_role")
+        self._max_parallel = self_review_config.get("max_parallel", 8)
+        self._critique_prompt_max_chars = self_review_config.get("critique_prompt_max_chars", 8000)
+        self._self_improve_model = full_config.get("critique_refine_config", {}).get(
+            "generator_model", "gemini-1.5-flash"
+        )
         if output_dir is None:
             self.output_dir = Path("reviews") / "self-improve"
         else:
             self.output_dir = output_dir
         self.output_dir.mkdir(parents=True, exist_ok=True)
         self.review_analyzer = ReviewAnalyzer(self.output_dir)  # Initialize ReviewAnalyzer
+        # (newest log mtime, log count) -> suggestions, reused until a log is added or removed.
+        self._analyzer_cache: Optional[Tuple[Tuple[float, int], str]] = None
+
+    def _cached_suggestions(self) -> str:
+        """Return the ReviewAnalyzer suggestions, recomputing only when the analyzed logs change."""
+        latest_mtime, log_count = 0.0, 0
+        with os.scandir(self.output_dir) as entries:
+            for entry in entries:
+                # Same file set as ReviewAnalyzer.get_recent_insights.
+                if (
+                    entry.name.startswith("log_of_")
+                    and entry.name.endswith((".json", ".jsonl"))
+                    and entry.is_file()
+                ):
+                    log_count += 1
+                    latest_mtime = max(latest_mtime, entry.stat().st_mtime)
+        cache_key = (latest_mtime, log_count)
+        if self._analyzer_cache is not None and self._analyzer_cache[0] == cache_key:
+            return self._analyzer_cache[1]
+
+        suggestions = self.review_analyzer.analyze_for_tool_improvement_suggestions()
+        self._analyzer_cache = (cache_key, suggestions)
+        return suggestions
 
     def _get_prior_review_context(self, num_reviews: int = 3) -> str:
         """Gets context from the most recent review files and tool improvement suggestions."""
@@ -43,18 +121,22 @@ class SelfReviewTool:
         if not review_dir.exists():
             return ""
 
-        review_files = sorted(
-            review_dir.glob("review_of_*.md"), key=os.path.getmtime, reverse=True
-        )
-
-        latest_reviews_content = []
-        for review_file in review_files[:num_reviews]:
-            try:
-                latest_reviews_content.append(review_file.read_text(encoding="utf-8"))
-            except IOError as e:
-                logging.warning(f"Could not read review file {review_file}: {e}")
+        # One stat per entry, and only the newest num_reviews are ordered.
+        with os.scandir(review_dir) as entries:
+            candidates = [
+                (entry.stat(follow_symlinks=False).st_mtime, entry.path)
+                for entry in entries
+                if entry.is_file()
+                and entry.name.startswith("review_of_")
+                and entry.name.endswith(".md")
+            ]
+        review_files = [Path(path) for _, path in heapq.nlargest(num_reviews, candidates)]
+
+        latest_reviews_content = [
+            content for content in _read_texts(review_files) if content is not None
+        ]
 
-        tool_improvement_suggestions = self.review_analyzer.analyze_for_tool_improvement_suggestions()
+        tool_improvement_suggestions = self._cached_suggestions()
 
         context_parts = []
         if latest_reviews_content:
@@ -65,24 +147,12 @@ class SelfReviewTool:
         return "\n\n".join(context_parts)
 
 
-    async def _load_file_content(self, file_path: Path) -> str:
-        """Load the content of a file, prepending project context and prior review context.
-
-        Args:
-            file_path: The path to the file to load.
+    def _load_shared_context(self) -> Tuple[str, str]:
+        """Load the context shared by every file in a run.
 
         Returns:
-            The file content with project context and recent reviews prepended.
-
-        Raises:
-            FileNotFoundError: If the target file does not exist.
+            A tuple of the project context and the prior review context.
         """
-        logging.info("Loading file content from: %s", file_path)
-        if not file_path.exists():
-            raise FileNotFoundError(f"Target file not found: {file_path}")
-
-        content_to_review = file_path.read_text(encoding="utf-8")
-
         project_context_path = get_project_context_path()
         project_context = ""
         if project_context_path and project_context_path.exists():
@@ -94,15 +164,48 @@ class SelfReviewTool:
                 project_context_path,
             )
 
-        prior_review_context = self._get_prior_review_context()
+        return project_context, self._get_prior_review_context()
+
+    async def _load_file_content(
+        self,
+        file_path: Path,
+        project_context: str = "",
+        prior_review_context: str = "",
+    ) -> Tuple[str, str]:
+        """Load the content of a file, prepending project context and prior review context.
+
+        Args:
+            file_path: The path to the file to load.
+            project_context: The project context shared by all files in the run.
+            prior_review_context: Recent reviews and tool improvement suggestions.
+
+        Returns:
+            A tuple of the raw file content and the content with project context
+            and recent reviews prepended.
+
+        Raises:
+            FileNotFoundError: If the target file does not exist.
+        """
+        logging.info("Loading file content from: %s", file_path)
+        return await asyncio.to_thread(
+            self._sync_load, file_path, project_context, prior_review_context
+        )
+
+    @staticmethod
+    def _sync_load(
+        file_path: Path, project_context: str, prior_review_context: str
+    ) -> Tuple[str, str]:
+        """Blocking body of _load_file_content, run in a single worker-thread hop."""
+        try:
+            content_to_review = file_path.read_text(encoding="utf-8")
+        except FileNotFoundError as e:
+            raise FileNotFoundError(f"Target file not found: {file_path}") from e
 
         # Prepend project context and prior review context to the content to be reviewed
-        full_content_to_review = (
-            f"{project_context}\n\n"
-            f"{prior_review_context}\n\n"
-            f"---\n\n{content_to_review}"
+        full_content_to_review = "".join(
+            (project_context, "\n\n", prior_review_context, "\n\n---\n\n", content_to_review)
         )
-        return full_content_to_review
+        return content_to_review, full_content_to_review
 
     async def _run_review_loop(
         self, initial_content: str, review_config: Dict[str, Any], dry_run: bool
@@ -118,8 +221,9 @@ class SelfReviewTool:
             A tuple containing the final refined output and the run log.
         """
         logging.info("Starting critique-refine loop for self-review.")
-        run_config = build_run_config(review_config, self.full_config)
-        run_config.dry_run = dry_run
+        run_config = dataclasses.replace(
+            build_run_config(review_config, self.full_config), dry_run=dry_run
+        )
 
         loop = CritiqueRefineLoop(run_config, strategy=review_config.get("strategy"))
         final_output, run_log = await loop.run(
@@ -128,9 +232,28 @@ class SelfReviewTool:
         )
         return final_output, run_log
 
+    @staticmethod
+    def _write_review_markdown(
+        output_filepath: Path,
+        original_file_path: Path,
+        original_content: str,
+        current_timestamp: datetime,
+        final_output: str,
+    ) -> None:
+        """Write the Markdown review file."""
+        review = (
+            f"# Self-Review of {original_file_path}\n\n"
+            f"**Timestamp:** {current_timestamp.isoformat()}\n\n"
+            f"**Original Content:**\n```\n"
+            f"{original_content}\n```\n\n"
+            f"**Critique-Refine Output:**\n{final_output}\n"
+        )
+        output_filepath.write_text(review, encoding="utf-8")
+
     async def _save_output(
         self,
         original_file_path: Path,
+        original_content: str,
         final_output: str,
         run_log: Dict[str, Any],
         save_improvement: bool,
@@ -142,6 +265,7 @@ class SelfReviewTool:
 
         Args:
             original_file_path: Path to the original file that was reviewed.
+            original_content: The content of the original file, as loaded for review.
             final_output: The final refined text from the loop.
             run_log: The structured log of the critique-refine run.
             save_improvement: Whether to save the suggested improvement to a file.
@@ -149,39 +273,57 @@ class SelfReviewTool:
         Returns:
             A list of strings describing the results of the save operations.
         """
+        # All writes for one review happen in a single worker-thread hop.
+        return await asyncio.to_thread(
+            self._sync_save_all,
+            original_file_path,
+            original_content,
+            final_output,
+            run_log,
+            save_improvement,
+        )
+
+    def _sync_save_all(
+        self,
+        original_file_path: Path,
+        original_content: str,
+        final_output: str,
+        run_log: Dict[str, Any],
+        save_improvement: bool,
+    ) -> List[str]:
+        """Blocking body of _save_output; see that method for details."""
         results = []
         current_timestamp = datetime.now()
+        # Shared by every output file name of this review.
+        file_suffix = f"{original_file_path.name}_{current_timestamp.strftime('%Y%m%d_%H%M%S')}"
 
         # Save Markdown review
-        output_filename = (
-            f"review_of_{original_file_path.name}_"
-            f"{current_timestamp.strftime('%Y%m%d_%H%M%S')}.md"
-        )
+        output_filename = f"review_of_{file_suffix}.md"
         output_filepath = self.output_dir / output_filename
         try:
-            with open(output_filepath, "w", encoding="utf-8") as f:
-                f.write(f"# Self-Review of {original_file_path}\n\n")
-                f.write(f"**Timestamp:** {current_timestamp.isoformat()}\n\n")
-                f.write(
-                    f"**Original Content:**\n```\n"
-                    f"{original_file_path.read_text(encoding='utf-8')}\n```\n\n"
-                )
-                f.write(f"**Critique-Refine Output:**\n{final_output}\n")
+            self._write_review_markdown(
+                output_filepath,
+                original_file_path,
+                original_content,
+                current_timestamp,
+                final_output,
+            )
             results.append(f"Review saved to: {output_filepath}")
         except OSError as e:
             results.append(f"Error saving review to {output_filepath}: {e}")
 
         # Save structured JSON log
-        log_filename = (
-            f"log_of_{original_file_path.name}_"
-            f"{current_timestamp.strftime('%Y%m%d_%H%M%S')}.json"
-        )
+        log_filename = f"log_of_{file_suffix}.json"
         log_filepath = self.output_dir / log_filename
+        # Write to a temporary name and rename it into place, so the analyzer never
+        # reads a partially written log from a review that is still saving.
+        tmp_filepath = log_filepath.with_name(f".{log_filename}.tmp")
         try:
-            with open(log_filepath, "w", encoding="utf-8") as f:
-                json.dump(run_log, f, indent=2)
+            tmp_filepath.write_bytes(_dump_json(run_log))
+            os.replace(tmp_filepath, log_filepath)
             results.append(f"Structured log saved to: {log_filepath}")
         except (OSError, TypeError) as e:
+            tmp_filepath.unlink(missing_ok=True)
             results.append(f"Error saving structured log to {log_filepath}: {e}")
 
         if save_improvement:
@@ -190,8 +332,7 @@ class SelfReviewTool:
             )
             suggested_filepath = original_file_path.parent / suggested_filename
             try:
-                with open(suggested_filepath, "w", encoding="utf-8") as f:
-                    f.write(final_output)
+                suggested_filepath.write_text(final_output, encoding="utf-8")
                 results.append(f"Suggested improvement saved to: {suggested_filepath}")
             except OSError as e:
                 results.append(f"Error saving suggested improvement to {suggested_filepath}: {e}")
@@ -203,6 +344,8 @@ class SelfReviewTool:
         save_improvement: bool,
         strategy_override: Optional[str],
         dry_run: bool,
+        project_context: str = "",
+        prior_review_context: str = "",
     ) -> List[str]:
         """Run the complete self-review process for a single file.
 
@@ -211,20 +354,23 @@ class SelfReviewTool:
             save_improvement: Whether to save the suggested improvement.
             strategy_override: An optional strategy to override the default.
             dry_run: If True, simulates the run without saving files.
+            project_context: The project context shared by all files in the run.
+            prior_review_context: Recent reviews and tool improvement suggestions.
 
         Returns:
             A list of strings summarizing the outcome.
         """
         try:
-            content_to_review = await self._load_file_content(target_path)
+            original_content, content_to_review = await self._load_file_content(
+                target_path, project_context, prior_review_context
+            )
             print(f"\n--- Reviewing: {target_path} ---")
 
             # Create a configuration dictionary to pass to build_run_config
-            self_review_config = self.full_config.get("self_review_config", {})
             review_config = {
                 "strategy": strategy_override,
-                "critic_role": self_review_config.get("default_critic_role"),
-                "refiner_role": self_review_config.get("default_refiner_role"),
+                "critic_role": self._default_critic_role,
+                "refiner_role": self._default_refiner_role,
                 "multi_critic_roles": None,
                 "redact_logs": False,
                 "save_improvement": save_improvement,
@@ -243,13 +389,19 @@ class SelfReviewTool:
             if dry_run:
                 return [f"Dry run mode for {target_path}: No files saved."]
 
-            save_results = await self._save_output(
-                target_path, final_output, run_log, save_improvement
-            )
-
-            # Run self-improvement critique after the main review is done
-            self_improve_suggestions = await self._run_self_improvement_critique(
-                target_path.name, content_to_review, final_output, run_log
+            # Analyze past logs before this run's log is written, and off the event
+            # loop, so the analyzer never sees a half-written log.
+            insights_summary = await asyncio.to_thread(self._cached_suggestions)
+
+            # Saving is disk-bound and the self-improvement critique is a model call;
+            # neither depends on the other, so they run concurrently.
+            save_results, self_improve_suggestions = await asyncio.gather(
+                self._save_output(
+                    target_path, original_content, final_output, run_log, save_improvement
+                ),
+                self._run_self_improvement_critique(
+                    target_path.name, content_to_review, final_output, run_log, insights_summary
+                ),
             )
             if self_improve_suggestions:
                 print(f"\n--- Self-Improvement Suggestions for the Tool ---\n{self_improve_suggestions}\n")
@@ -273,20 +425,22 @@ class SelfReviewTool:
         original_content: str,
         final_output: str,
         run_log: Dict[str, Any],
+        insights_summary: str,
     ) -> str:
         """
         Runs a critique specifically for self-improvement suggestions based on the review outcome.
+
+        ``insights_summary`` is the ReviewAnalyzer output for past runs (see
+        ``_cached_suggestions``).
         """
         logging.info("Running self-improvement critique for the tool.")
-        
-        # Prepare context for the self-improvement critic
-        insights_summary = self.review_analyzer.analyze_for_tool_improvement_suggestions()
-        
+
+        max_chars = self._critique_prompt_max_chars
         prompt_content = (
             f"Review of file: {original_file_name}\n\n"
-            f"Original content:\n{original_content}\n\n"
-            f"Final refined output:\n{final_output}\n\n"
-            f"Run log summary:\n{json.dumps(run_log, indent=2)}\n\n"
+            f"Original content:\n{_truncate(original_content, max_chars)}\n\n"
+            f"Final refined output:\n{_truncate(final_output, max_chars)}\n\n"
+            f"Run log summary:\n{_dump_json(_summarize_run_log(run_log)).decode('utf-8')}\n\n"
             f"Past review insights:\n{insights_summary}\n\n"
             f"Based on this information, provide concrete suggestions to improve the CritiqueRefineTool itself (e.g., adjust strategy parameters, suggest new roles, refine prompts)."
         )
@@ -299,7 +453,7 @@ class SelfReviewTool:
             # For simplicity, using generator_model here, but ideally it would be a dedicated model
             self_improve_critique = await call_model(
                 prompt=prompt_content,
-                model_name=self.full_config.get("critique_refine_config", {}).get("generator_model", "gemini-1.5-flash"), # Or a dedicated self_improve_model
+                model_name=self._self_improve_model, # Or a dedicated self_improve_model
                 system_prompt=self_improve_template,
                 config=self.full_config,
                 dry_run=False, # Always run self-improvement critique, even in dry_run mode for main loop
@@ -329,12 +483,44 @@ class SelfReviewTool:
             A formatted string containing the results for all files.
         """
         logging.info("Starting self-review run for %d files.", len(file_paths))
-        tasks = [
-            self._review_one_file(
-                path, save_improvement, strategy_override, dry_run
-            )
-            for path in file_paths
-        ]
+        # Project context and prior reviews are identical for every file; load them once.
+        # Dry runs make no model calls, so they skip loading context altogether.
+        if dry_run:
+            project_context, prior_review_context = "", ""
+        else:
+            try:
+                project_context, prior_review_context = await asyncio.to_thread(
+                    self._load_shared_context
+                )
+            except (FileNotFoundError, ValueError, IOError) as e:
+                # Report the failure per file, as when each file loaded its own context.
+                return "\n".join(f"Error during self-review of {path}: {e}" for path in file_paths)
+            except Exception as e:
+                logging.critical(
+                    "An unexpected error occurred while loading the self-review context: %s",
+                    e,
+                    exc_info=True,
+                )
+                return "\n".join(
+                    f"An unexpected error occurred during self-review of {path}: {e}"
+                    for path in file_paths
+                )
+        # Bound concurrent reviews so large runs stay under model rate limits and
+        # only a few files' full contexts are held in memory at once.
+        semaphore = asyncio.Semaphore(self._max_parallel)
+
+        async def _guarded_review(path: Path) -> List[str]:
+            async with semaphore:
+                return await self._review_one_file(
+                    path,
+                    save_improvement,
+                    strategy_override,
+                    dry_run,
+                    project_context=project_context,
+                    prior_review_context=prior_review_context,
+                )
+
+        tasks = [_guarded_review(path) for path in file_paths]
         results_nested = await asyncio.gather(*tasks)
         all_results = [item for sublist in results_nested for item in sublist]
         return "\n".join(all_results)
@@ -1,4 +1,5 @@
 import asyncio
+import dataclasses
 import logging
 from contextlib import asynccontextmanager
 from dataclasses import dataclass
@@ -6,6 +7,12 @@ from typing import AsyncIterator, List, Optional
 
 from fastmcp import Context, FastMCP
 
+try:
+    import uvloop
+except ImportError:
+    # uvloop is optional; fall back to the default asyncio event loop.
+    uvloop = None
+
 from mcp_servers.critique_refine.core.loop import CritiqueRefineLoop
 from mcp_servers.critique_refine.core.model_router import initialize, ModelAPIError
 from mcp_servers.critique_refine.models import CritiqueRefineResult
@@ -90,7 +97,7 @@ async def run_critique_refine_loop(
     run_config = build_run_config(args_dict, critique_refine_logic.full_config)
 
     if iterations is not None:
-        run_config.max_rounds = iterations
+        run_config = dataclasses.replace(run_config, max_rounds=iterations)
 
     try:
         loop = CritiqueRefineLoop(run_config, strategy=strategy_name)
@@ -112,4 +119,8 @@ async def run_critique_refine_loop(
 if __name__ == "__main__":
     # Basic logging setup for the server
     logging.basicConfig(level=logging.DEBUG, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
-    asyncio.run(mcp.run_stdio_async())
+    if uvloop is None:
+        asyncio.run(mcp.run_stdio_async())
+    else:
+        with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+            runner.run(mcp.run_stdio_async())
@@ -0,0 +1,34 @@
+"""Shared test setup.
+
+The tool is deployed as the ``mcp_servers.critique_refine`` package (see
+server.py), and the modules under core/ and utils/ import each other
+relatively within it. When the repository is checked out on its own, that
+package path is registered here so the tests can import the real modules.
+"""
+import importlib
+import sys
+import types
+from pathlib import Path
+
+_PACKAGE = "mcp_servers.critique_refine"
+_ROOT = Path(__file__).resolve().parent.parent
+
+
+def _register_package() -> None:
+    try:
+        importlib.import_module(_PACKAGE)
+        return
+    except ImportError:
+        pass
+    parent = sys.modules.get("mcp_servers")
+    if parent is None:
+        parent = types.ModuleType("mcp_servers")
+        parent.__path__ = []
+        sys.modules["mcp_servers"] = parent
+    package = types.ModuleType(_PACKAGE)
+    package.__path__ = [str(_ROOT)]
+    sys.modules[_PACKAGE] = package
+    parent.critique_refine = package
+
+
+_register_package()
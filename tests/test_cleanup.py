@@ -0,0 +1,45 @@
+import os
+import time
+
+from mcp_servers.critique_refine.utils import cleanup
+
+NOW = 1_700_000_000.0
+DAY = 86400
+
+
+def _make_log(directory, name, age_seconds):
+    path = directory / name
+    path.write_text("{}", encoding="utf-8")
+    mtime = NOW - age_seconds
+    os.utime(path, (mtime, mtime))
+    return path
+
+
+def test_cleanup_archives_only_logs_older_than_archive_days(tmp_path, monkeypatch):
+    monkeypatch.setattr(cleanup.time, "time", lambda: NOW)
+    log_dir = tmp_path / "logs"
+    log_dir.mkdir()
+    archive_dir = tmp_path / "archive"
+    # Whole days of age must exceed archive_days, so 7 days and 23 hours is kept.
+    kept = _make_log(log_dir, "kept.json", 8 * DAY - 1)
+    boundary = _make_log(log_dir, "boundary.jsonl", 8 * DAY)
+    old = _make_log(log_dir, "old.json", 30 * DAY)
+    other = _make_log(log_dir, "notes.txt", 30 * DAY)
+
+    cleanup.cleanup_logs([str(log_dir)], archive_base_dir=str(archive_dir), archive_days=7)
+
+    assert kept.exists()
+    assert other.exists()
+    assert not boundary.exists()
+    assert not old.exists()
+    for name, age in (("boundary.jsonl", 8 * DAY), ("old.json", 30 * DAY)):
+        archive_date = time.strftime("%Y-%m-%d", time.localtime(NOW - age))
+        assert (archive_dir / archive_date / name).exists()
+
+
+def test_cleanup_skips_missing_log_dir(tmp_path):
+    archive_dir = tmp_path / "archive"
+
+    cleanup.cleanup_logs([str(tmp_path / "missing")], archive_base_dir=str(archive_dir))
+
+    assert not archive_dir.exists()
@@ -0,0 +1,111 @@
+import logging
+
+import pytest
+
+from mcp_servers.critique_refine.utils import config
+
+BASE_CONFIG = {
+    "default_critic_role": "critic.txt",
+    "default_refiner_role": "refiner.txt",
+    "meta_critic_role": "meta_critic.txt",
+    "max_rounds": 3,
+}
+
+STRATEGIES = {
+    "deep": ["security", "style.txt"],
+    "tuned": {
+        "roles": ["performance"],
+        "max_rounds": 5,
+        "default_refiner_role_prompt_file": "careful_refiner.txt",
+    },
+    "rounds_only": {"max_rounds": 1},
+}
+
+
+@pytest.fixture(autouse=True)
+def fake_sources(monkeypatch):
+    """Serve the base config, strategies and templates from memory."""
+    monkeypatch.setattr(config, "get_critique_refine_config", lambda: dict(BASE_CONFIG))
+    monkeypatch.setattr(config, "get_strategy_config", STRATEGIES.get)
+    monkeypatch.setattr(config, "load_role_template", lambda name: f"<{name}>")
+
+
+def test_base_config_only():
+    run_env = config.prepare_run_environment({})
+
+    assert run_env["config"] == {
+        **BASE_CONFIG,
+        "default_critic_role_prompt_file": "critic.txt",
+        "default_refiner_role_prompt_file": "refiner.txt",
+    }
+    assert run_env["roles"] == {
+        "critic_template": "<critic.txt>",
+        "refiner_template": "<refiner.txt>",
+        "meta_critic_template": "<meta_critic.txt>",
+    }
+
+
+def test_list_strategy_replaces_default_critic():
+    current = config.prepare_run_environment({"strategy": "deep"})["config"]
+
+    assert current["multi_critic_roles"] == ["security.txt", "style.txt"]
+    assert "default_critic_role_prompt_file" not in current
+
+
+def test_dict_strategy_overrides_base_values():
+    run_env = config.prepare_run_environment({"strategy": "tuned"})
+    current = run_env["config"]
+
+    assert current["multi_critic_roles"] == ["performance.txt"]
+    assert current["max_rounds"] == 5
+    assert "roles" not in current
+    assert "default_critic_role_prompt_file" not in current
+    assert run_env["roles"]["refiner_template"] == "<careful_refiner.txt>"
+
+
+def test_strategy_without_roles_keeps_default_critic():
+    current = config.prepare_run_environment({"strategy": "rounds_only"})["config"]
+
+    assert current["max_rounds"] == 1
+    assert current["default_critic_role_prompt_file"] == "critic.txt"
+    assert "multi_critic_roles" not in current
+
+
+def test_cli_critic_role_overrides_strategy_roles(caplog):
+    with caplog.at_level(logging.WARNING):
+        run_env = config.prepare_run_environment({"strategy": "tuned", "critic_role": "strict.txt"})
+    current = run_env["config"]
+
+    assert current["default_critic_role_prompt_file"] == "strict.txt"
+    assert "multi_critic_roles" not in current
+    assert current["max_rounds"] == 5
+    assert run_env["roles"]["critic_template"] == "<strict.txt>"
+    assert "overrides multi-critic strategy" in caplog.text
+
+
+def test_cli_multi_critic_roles_override_everything():
+    current = config.prepare_run_environment({
+        "strategy": "deep",
+        "critic_role": "strict.txt",
+        "refiner_role": "gentle.txt",
+        "multi_critic_roles": "a,b.txt",
+    })["config"]
+
+    assert current["multi_critic_roles"] == ["a.txt", "b.txt"]
+    assert "default_critic_role_prompt_file" not in current
+    assert current["default_refiner_role_prompt_file"] == "gentle.txt"
+
+
+def test_unknown_strategy_raises():
+    with pytest.raises(ValueError, match="Strategy 'missing' not found"):
+        config.prepare_run_environment({"strategy": "missing"})
+
+
+def test_missing_template_raises_value_error(monkeypatch):
+    def missing(name):
+        raise config.TemplateNotFoundError(name)
+
+    monkeypatch.setattr(config, "load_role_template", missing)
+
+    with pytest.raises(ValueError, match="Error loading role template"):
+        config.prepare_run_environment({})
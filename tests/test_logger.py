@@ -0,0 +1,43 @@
+import json
+
+from mcp_servers.critique_refine.utils.logger import Logger
+
+
+def test_log_run_appends_one_compact_line_per_entry(tmp_path):
+    log_path = tmp_path / "logs" / "run.jsonl"
+    logger = Logger(str(log_path))
+
+    logger.log_run({"round": 1, "text": "é"})
+    logger.log_run({"round": 2})
+
+    lines = log_path.read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line) for line in lines] == [{"round": 1, "text": "é"}, {"round": 2}]
+    assert lines[1] == '{"round":2}'
+
+
+def test_invalid_redaction_pattern_ignored_when_not_redacting(tmp_path):
+    log_path = tmp_path / "run.jsonl"
+    logger = Logger(str(log_path), redact=False, redaction_patterns=[("(unclosed", "X")])
+
+    logger.log_run({"text": "(unclosed"})
+
+    assert json.loads(log_path.read_text(encoding="utf-8")) == {"text": "(unclosed"}
+
+
+def test_log_run_redacts_keys_and_patterns(tmp_path):
+    log_path = tmp_path / "run.jsonl"
+    logger = Logger(
+        str(log_path),
+        redact=True,
+        keys_to_redact=["token"],
+        redaction_patterns=[(r"\S+@\S+", "[REDACTED_EMAIL]")],
+    )
+    entry = {"token": "abc", "notes": ["mail a@b.com"]}
+
+    logger.log_run(entry)
+
+    assert json.loads(log_path.read_text(encoding="utf-8")) == {
+        "token": "[REDACTED_TOKEN]",
+        "notes": ["mail [REDACTED_EMAIL]"],
+    }
+    assert entry == {"token": "abc", "notes": ["mail a@b.com"]}
@@ -0,0 +1,159 @@
+import asyncio
+
+import pytest
+
+from mcp_servers.critique_refine.core import loop as loop_module
+from mcp_servers.critique_refine.core.config import RunConfig
+from mcp_servers.critique_refine.core.loop import CritiqueRefineLoop
+
+
+class FakeModels:
+    """Stands in for call_model, answering by role and recording refiner cancellation."""
+
+    def __init__(self, actionable=True):
+        self.actionable = actionable
+        self.meta_started = asyncio.Event()
+        self.meta_release = asyncio.Event()
+        self.meta_release.set()
+        self.refiner_started = asyncio.Event()
+        self.refiner_release = asyncio.Event()
+        self.refiner_release.set()
+        # Cleared to make a cancelled refiner linger before finishing.
+        self.refiner_cleanup = asyncio.Event()
+        self.refiner_cleanup.set()
+        self.refiner_cancel_seen = asyncio.Event()
+        self.refiner_cancelled = False
+
+    async def __call__(self, prompt, model_name=None, system_prompt=None, config=None, dry_run=False, role=None):
+        if role == "critic":
+            return "critique"
+        if role == "meta_critic":
+            self.meta_started.set()
+            await self.meta_release.wait()
+            return '{"actionable": %s}' % ("true" if self.actionable else "false")
+        if role == "refiner":
+            self.refiner_started.set()
+            try:
+                await self.refiner_release.wait()
+            except asyncio.CancelledError:
+                self.refiner_cancelled = True
+                self.refiner_cancel_seen.set()
+                await self.refiner_cleanup.wait()
+                raise
+            return "refined"
+        raise AssertionError(f"unexpected role {role}")
+
+
+@pytest.fixture
+def make_loop(tmp_path, monkeypatch):
+    def _make(models, max_rounds=1):
+        monkeypatch.setattr(loop_module, "call_model", models)
+        run_config = RunConfig(
+            generator_model="gen",
+            critic_model="critic",
+            refiner_model="refiner",
+            meta_critic_model="meta",
+            fallback_model="fallback",
+            max_rounds=max_rounds,
+            stop_threshold=1,
+            log_file_path=str(tmp_path / "run.jsonl"),
+            redact_logs=False,
+            full_config={},
+            roles={"meta_critic_template": "meta prompt"},
+            default_critic_role_prompt_file="critic.txt",
+        )
+        critique_loop = CritiqueRefineLoop(run_config)
+        critique_loop._templates = {"critic.txt": "critic prompt"}
+        return critique_loop
+
+    return _make
+
+
+def test_actionable_critique_keeps_speculative_refinement(make_loop):
+    models = FakeModels(actionable=True)
+    critique_loop = make_loop(models, max_rounds=2)
+
+    result = asyncio.run(critique_loop._run_critique_refine_loop("draft"))
+
+    assert result == "refined"
+    assert [r["text"] for r in critique_loop.run_log["refinements"]] == ["refined", "refined"]
+    assert not models.refiner_cancelled
+
+
+def test_non_actionable_critique_discards_speculative_refinement(make_loop):
+    models = FakeModels(actionable=False)
+    critique_loop = make_loop(models)
+
+    async def scenario():
+        models.meta_release.clear()
+        models.refiner_release.clear()
+        task = asyncio.create_task(critique_loop._run_critique_refine_loop("draft"))
+        # Let the refiner start before the meta-critic answers, so it must be cancelled.
+        await models.refiner_started.wait()
+        models.meta_release.set()
+        return await task
+
+    result = asyncio.run(scenario())
+
+    assert result == "draft"
+    assert models.refiner_cancelled
+    assert critique_loop.run_log["refinements"] == []
+    assert critique_loop.run_log["reason_for_stopping"] == "Non-actionable critique received in round 1."
+
+
+def test_caller_cancellation_propagates_and_cancels_refinement(make_loop):
+    models = FakeModels(actionable=True)
+    critique_loop = make_loop(models)
+
+    async def scenario():
+        models.meta_release.clear()
+        models.refiner_release.clear()
+        task = asyncio.create_task(critique_loop._run_critique_refine_loop("draft"))
+        await models.meta_started.wait()
+        await models.refiner_started.wait()
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(scenario())
+
+    assert models.refiner_cancelled
+    assert critique_loop.run_log["refinements"] == []
+
+
+def test_caller_cancellation_while_discarding_propagates(make_loop):
+    models = FakeModels(actionable=False)
+    critique_loop = make_loop(models)
+
+    async def scenario():
+        models.meta_release.clear()
+        models.refiner_release.clear()
+        models.refiner_cleanup.clear()
+        task = asyncio.create_task(critique_loop._run_critique_refine_loop("draft"))
+        await models.refiner_started.wait()
+        models.meta_release.set()
+        # The critique is not actionable, so the loop is now waiting for the
+        # cancelled refinement to finish; cancel the loop itself meanwhile.
+        await models.refiner_cancel_seen.wait()
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(scenario())
+
+
+def test_discard_task_swallows_child_outcome():
+    async def failing():
+        await asyncio.sleep(0)
+        raise RuntimeError("boom")
+
+    async def scenario():
+        done = asyncio.create_task(failing())
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        await CritiqueRefineLoop._discard_task(done)
+        pending = asyncio.create_task(asyncio.sleep(10))
+        await CritiqueRefineLoop._discard_task(pending)
+        return pending.cancelled()
+
+    assert asyncio.run(scenario())
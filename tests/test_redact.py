@@ -0,0 +1,59 @@
+import re
+
+from mcp_servers.critique_refine.utils.redact import compile_redaction_patterns
+
+
+def _apply(compiled, text):
+    for pattern, replacement in compiled:
+        text = pattern.sub(replacement, text)
+    return text
+
+
+def _apply_separately(patterns, text):
+    for pattern, replacement in patterns:
+        text = re.sub(pattern, replacement, text, flags=re.IGNORECASE)
+    return text
+
+
+def test_plain_patterns_merge_into_one_alternation():
+    patterns = [(r"sk-[a-z0-9]+", "[KEY]"), (r"\b\d{3}-\d{4}\b", "[PHONE]"), (r"secret", "[WORD]")]
+    text = "Call 555-1234 with SK-abc123, it's a SECRET."
+
+    compiled = compile_redaction_patterns(patterns)
+
+    assert len(compiled) == 1
+    assert _apply(compiled, text) == "Call [PHONE] with [KEY], it's a [WORD]."
+    assert _apply(compiled, text) == _apply_separately(patterns, text)
+
+
+def test_patterns_with_groups_are_kept_separate():
+    patterns = [(r"(user)=\w+", r"\1=[REDACTED]"), (r"token", "[TOKEN]")]
+
+    compiled = compile_redaction_patterns(patterns)
+
+    assert len(compiled) == 2
+    assert _apply(compiled, "user=alice token") == "user=[REDACTED] [TOKEN]"
+
+
+def test_backslash_replacement_is_kept_separate():
+    patterns = [(r"a+", r"\g<0>!"), (r"b", "[B]")]
+
+    compiled = compile_redaction_patterns(patterns)
+
+    assert len(compiled) == 2
+    assert _apply(compiled, "aab") == "aa![B]"
+
+
+def test_inline_flags_fall_back_to_separate_patterns():
+    patterns = [(r"(?s)begin.*end", "[BLOCK]"), (r"key", "[KEY]")]
+
+    compiled = compile_redaction_patterns(patterns)
+
+    assert len(compiled) == 2
+    assert _apply(compiled, "begin\nx end key") == "[BLOCK] [KEY]"
+
+
+def test_single_or_no_pattern_is_not_merged():
+    assert compile_redaction_patterns([]) == []
+    compiled = compile_redaction_patterns([(r"x", "y")])
+    assert len(compiled) == 1 and compiled[0][1] == "y"
@@ -0,0 +1,68 @@
+import json
+
+from mcp_servers.critique_refine.utils import review_analyzer
+from mcp_servers.critique_refine.utils.review_analyzer import ReviewAnalyzer
+
+
+def _write_jsonl(path, entries, trailer=""):
+    path.write_text(
+        "".join(json.dumps(entry) + "\n" for entry in entries) + trailer, encoding="utf-8"
+    )
+
+
+def test_iter_log_entries_skips_blank_and_undecodable_lines(tmp_path):
+    log_path = tmp_path / "log_of_a.jsonl"
+    log_path.write_text('{"n": 0}\n\nnot json\n{"n": 1}\n', encoding="utf-8")
+
+    entries = list(ReviewAnalyzer(tmp_path)._iter_log_entries(log_path))
+
+    assert entries == [{"n": 0}, {"n": 1}]
+
+
+def test_load_latest_entry_returns_last_jsonl_entry(tmp_path):
+    log_path = tmp_path / "log_of_a.jsonl"
+    _write_jsonl(log_path, [{"n": i} for i in range(5)], trailer="\n")
+
+    assert ReviewAnalyzer(tmp_path)._load_latest_entry(log_path) == {"n": 4}
+
+
+def test_load_latest_entry_skips_truncated_last_line(tmp_path):
+    log_path = tmp_path / "log_of_a.jsonl"
+    _write_jsonl(log_path, [{"n": 0}, {"n": 1}], trailer='{"n": 2, "text": "cut o')
+
+    assert ReviewAnalyzer(tmp_path)._load_latest_entry(log_path) == {"n": 1}
+
+
+def test_load_latest_entry_reads_only_tail_window(tmp_path, monkeypatch):
+    log_path = tmp_path / "log_of_a.jsonl"
+    _write_jsonl(log_path, [{"n": i, "pad": "x" * 20} for i in range(50)])
+    monkeypatch.setattr(review_analyzer, "_JSONL_TAIL_BYTES", 100)
+
+    assert ReviewAnalyzer(tmp_path)._load_latest_entry(log_path)["n"] == 49
+
+
+def test_load_latest_entry_falls_back_when_entry_exceeds_window(tmp_path, monkeypatch):
+    log_path = tmp_path / "log_of_a.jsonl"
+    _write_jsonl(log_path, [{"n": 0}, {"n": 1, "text": "y" * 500}])
+    monkeypatch.setattr(review_analyzer, "_JSONL_TAIL_BYTES", 64)
+
+    assert ReviewAnalyzer(tmp_path)._load_latest_entry(log_path)["n"] == 1
+
+
+def test_get_recent_insights_uses_newest_entry_of_jsonl_logs(tmp_path):
+    _write_jsonl(
+        tmp_path / "log_of_a.jsonl",
+        [
+            {"timestamp": "old", "final_output": "a"},
+            {"timestamp": "new", "final_output": "b", "critiques": [{"text": "short"}]},
+        ],
+    )
+
+    insights = ReviewAnalyzer(tmp_path).get_recent_insights()
+
+    assert [insight["timestamp"] for insight in insights] == ["new"]
+    assert insights[0]["critiques"] == [{"text": "short"}]
+
+
+def test_get_recent_insights_missing_directory(tmp_path):
+    assert ReviewAnalyzer(tmp_path / "missing").get_recent_insights() == []
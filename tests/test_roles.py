@@ -0,0 +1,44 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from mcp_servers.critique_refine.core import roles
+from mcp_servers.critique_refine.core.roles import TemplateNotFoundError, load_role_template
+
+
+@pytest.fixture(autouse=True)
+def _empty_cache():
+    roles.clear_template_cache()
+    yield
+    roles.clear_template_cache()
+
+
+def test_edited_template_is_reloaded(tmp_path):
+    template = tmp_path / "critic.txt"
+    template.write_text("v1", encoding="utf-8")
+    assert load_role_template("critic.txt", base_dir=tmp_path) == "v1"
+
+    template.write_text("v2 longer", encoding="utf-8")
+
+    assert load_role_template("critic.txt", base_dir=tmp_path) == "v2 longer"
+
+
+def test_missing_template_raises(tmp_path):
+    with pytest.raises(TemplateNotFoundError):
+        load_role_template("missing.txt", base_dir=tmp_path)
+
+
+def test_concurrent_loads_with_eviction(tmp_path, monkeypatch):
+    monkeypatch.setattr(roles, "_TEMPLATE_CACHE_MAX_ENTRIES", 4)
+    names = [f"role_{i}.txt" for i in range(16)]
+    for name in names:
+        (tmp_path / name).write_text(name, encoding="utf-8")
+
+    def load(i):
+        name = names[i % len(names)]
+        return load_role_template(name, base_dir=tmp_path) == name
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        assert all(executor.map(load, range(2000)))
+    assert len(roles._TEMPLATE_CACHE) <= 4
@@ -0,0 +1,77 @@
+import asyncio
+import os
+
+import pytest
+
+from mcp_servers.critique_refine.core import self_review
+from mcp_servers.critique_refine.core.self_review import SelfReviewTool
+
+
+@pytest.fixture
+def tool(tmp_path, monkeypatch):
+    """A SelfReviewTool writing to tmp_path whose analyzer counts its calls."""
+    review_tool = SelfReviewTool({}, output_dir=tmp_path)
+    review_tool.analyzer_calls = 0
+
+    def fake_analyze(num_logs=5):
+        review_tool.analyzer_calls += 1
+        return f"suggestions #{review_tool.analyzer_calls}"
+
+    monkeypatch.setattr(
+        review_tool.review_analyzer, "analyze_for_tool_improvement_suggestions", fake_analyze
+    )
+    return review_tool
+
+
+def test_cached_suggestions_reused_while_logs_unchanged(tool, tmp_path):
+    (tmp_path / "log_of_a.json").write_text("{}", encoding="utf-8")
+
+    assert tool._cached_suggestions() == "suggestions #1"
+    assert tool._cached_suggestions() == "suggestions #1"
+    assert tool.analyzer_calls == 1
+
+
+def test_cached_suggestions_recomputed_for_new_jsonl_log(tool, tmp_path):
+    (tmp_path / "log_of_a.json").write_text("{}", encoding="utf-8")
+    assert tool._cached_suggestions() == "suggestions #1"
+
+    (tmp_path / "log_of_b.jsonl").write_text("{}\n", encoding="utf-8")
+
+    assert tool._cached_suggestions() == "suggestions #2"
+
+
+def test_cached_suggestions_recomputed_for_touched_jsonl_log(tool, tmp_path):
+    log_path = tmp_path / "log_of_a.jsonl"
+    log_path.write_text("{}\n", encoding="utf-8")
+    assert tool._cached_suggestions() == "suggestions #1"
+
+    stat = log_path.stat()
+    os.utime(log_path, (stat.st_atime, stat.st_mtime + 10))
+
+    assert tool._cached_suggestions() == "suggestions #2"
+
+
+def test_run_reports_unreadable_project_context_per_file(tool, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    context_path = tmp_path / "project_context.md"
+    context_path.write_bytes(b"\xff\xfe not utf-8")
+    monkeypatch.setattr(self_review, "get_project_context_path", lambda: context_path)
+    files = [tmp_path / "a.py", tmp_path / "b.py"]
+
+    result = asyncio.run(tool.run(files, save_improvement=False, strategy_override=None))
+
+    assert result.splitlines() == [
+        f"Error during self-review of {files[0]}: 'utf-8' codec can't decode byte 0xff in position 0: invalid start byte",
+        f"Error during self-review of {files[1]}: 'utf-8' codec can't decode byte 0xff in position 0: invalid start byte",
+    ]
+
+
+def test_sync_save_all_leaves_only_the_final_log(tool, tmp_path):
+    source = tmp_path / "target.py"
+
+    results = tool._sync_save_all(source, "x = 1\n", "x = 2\n", {"final": "x = 2"}, False)
+
+    log_files = [p.name for p in tmp_path.iterdir() if p.name.startswith(("log_of_", ".log_of_"))]
+    assert len(log_files) == 1
+    assert log_files[0].endswith(".json")
+    assert any(r.startswith("Structured log saved to:") for r in results)
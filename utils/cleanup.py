@@ -1,8 +1,9 @@
 import os
 import shutil
-from datetime import datetime
+import time
 import logging
-from typing import List
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Tuple
 
 
 def cleanup_logs(log_dirs: List[str] = None, archive_base_dir="reviews/self-improve/archive", archive_days=7):
@@ -17,34 +18,69 @@ def cleanup_logs(log_dirs: List[str] = None, archive_base_dir="reviews/self-impr
     if log_dirs is None:
         log_dirs = ["logs", "reviews/self-improve"]
 
-    now = datetime.now()
-    
+    # A log is archived once it is more than archive_days whole days old.
+    cutoff = time.time() - (archive_days + 1) * 86400
+    # (source path, archive subdirectory, file name, source log dir) for every log to archive
+    moves: List[Tuple[str, str, str, str]] = []
+
     for log_dir in log_dirs:
         if not os.path.exists(log_dir):
             logging.info(f"Log directory '{log_dir}' does not exist. Skipping.")
             continue
 
-        for filename in os.listdir(log_dir):
-            filepath = os.path.join(log_dir, filename)
-            
-            # Process only .json and .jsonl files
-            if os.path.isfile(filepath) and (filename.endswith(".jsonl") or filename.endswith(".json")):
-                file_mtime = datetime.fromtimestamp(os.path.getmtime(filepath))
+        # scandir yields cached file types and a single stat per entry.
+        with os.scandir(log_dir) as entries:
+            for entry in entries:
+                filename = entry.name
+
+                # Process only .json and .jsonl files
+                if not (entry.is_file(follow_symlinks=False) and filename.endswith((".jsonl", ".json"))):
+                    logging.debug(f"Skipping non-log file: {filename} in {log_dir}")
+                    continue
+
+                file_mtime = entry.stat(follow_symlinks=False).st_mtime
 
                 # Archive old logs
-                if (now - file_mtime).days > archive_days:
-                    try:
-                        # Create a date-based subdirectory in the archive
-                        archive_subdir = os.path.join(archive_base_dir, file_mtime.strftime("%Y-%m-%d"))
-                        os.makedirs(archive_subdir, exist_ok=True)
-                        
-                        shutil.move(filepath, os.path.join(archive_subdir, filename))
-                        logging.info(f"Archived old log: {filename} from {log_dir}")
-                    except Exception as e:
-                        logging.error(f"Error archiving {filename} from {log_dir}: {e}")
+                if file_mtime <= cutoff:
+                    # Create a date-based subdirectory in the archive
+                    archive_date = time.strftime("%Y-%m-%d", time.localtime(file_mtime))
+                    archive_subdir = os.path.join(archive_base_dir, archive_date)
+                    moves.append((entry.path, archive_subdir, filename, log_dir))
+
+    if not moves:
+        return
+
+    failed_subdirs = set()
+    subdir_devices = {}
+    for archive_subdir in {move[1] for move in moves}:
+        try:
+            os.makedirs(archive_subdir, exist_ok=True)
+            subdir_devices[archive_subdir] = os.stat(archive_subdir).st_dev
+        except OSError as e:
+            logging.error(f"Error creating archive directory {archive_subdir}: {e}")
+            failed_subdirs.add(archive_subdir)
+
+    log_dir_devices = {log_dir: os.stat(log_dir).st_dev for log_dir in {move[3] for move in moves}}
+
+    def _archive(move: Tuple[str, str, str, str]) -> None:
+        filepath, archive_subdir, filename, log_dir = move
+        if archive_subdir in failed_subdirs:
+            logging.error(f"Error archiving {filename} from {log_dir}: archive directory unavailable")
+            return
+        try:
+            destination = os.path.join(archive_subdir, filename)
+            if log_dir_devices[log_dir] == subdir_devices[archive_subdir]:
+                # Same filesystem: a single rename, without shutil.move's probing or copy fallback.
+                os.replace(filepath, destination)
             else:
-                logging.debug(f"Skipping non-log file: {filename} in {log_dir}")
+                shutil.move(filepath, destination)
+            logging.info(f"Archived old log: {filename} from {log_dir}")
+        except Exception as e:
+            logging.error(f"Error archiving {filename} from {log_dir}: {e}")
 
+    # Moves across filesystems are copy+unlink and I/O-bound, so issue them concurrently.
+    with ThreadPoolExecutor(max_workers=min(32, len(moves))) as executor:
+        list(executor.map(_archive, moves))
 
 if __name__ == "__main__":
     # This part is for direct execution of the script
@@ -2,13 +2,20 @@
 import json
 import os
 from pathlib import Path
-from typing import Any, Dict, Optional
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Tuple
 from datetime import datetime
 import logging
 
 import yaml
 
-from ..core.roles import load_role_template, TemplateNotFoundError
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    # libyaml is not available; fall back to the pure-Python loader.
+    from yaml import SafeLoader as _YamlLoader
+
+from ..core.roles import clear_template_cache, load_role_template, TemplateNotFoundError
 from ..core.config import RunConfig
 
 
@@ -21,13 +28,26 @@ except ImportError:
     pass
 
 
-_config: Optional[Dict[str, Any]] = None
+logger = logging.getLogger(__name__)
+
+_config: Optional[Mapping[str, Any]] = None
 _CONFIG_PATH = Path(__file__).parent.parent / "config.json"
+# Top-level config sections, cached on first access and cleared whenever the config is (re)loaded.
+_sections_cache: Dict[str, Mapping[str, Any]] = {}
+
+
+def _freeze(data: Dict[str, Any]) -> Mapping[str, Any]:
+    """Wrap a dict and the dicts nested in it in read-only views; lists are left as is."""
+    return MappingProxyType(
+        {key: _freeze(value) if isinstance(value, dict) else value for key, value in data.items()}
+    )
 
 
 def load_config(config_path: Path = _CONFIG_PATH) -> None:
     """Load configuration from a JSON file into a module-level variable.
 
+    The loaded config and its nested sections are read-only mappings, so the
+    same objects can be handed to every run without defensive copies.
     This function fails fast if the file is not found or is malformed.
 
     Args:
@@ -35,10 +55,11 @@ def load_config(config_path: Path = _CONFIG_PATH) -> None:
     """
     # pylint: disable=global-statement
     global _config
+    _sections_cache.clear()
     try:
-        logging.info("Loading configuration from: %s", config_path)
+        logger.info("Loading configuration from: %s", config_path)
         with open(config_path, "r", encoding="utf-8") as f:
-            _config = json.load(f)
+            _config = _freeze(json.load(f))
     except FileNotFoundError as e:
         print(f"Error: Config file not found at {config_path}.")
         print("Please ensure 'config.json' exists in the project root.")
@@ -49,7 +70,7 @@ def load_config(config_path: Path = _CONFIG_PATH) -> None:
         raise SystemExit(1) from e
 
 
-def get_config() -> Dict[str, Any]:
+def get_config() -> Mapping[str, Any]:
     """Retrieve the entire loaded configuration.
 
     If the configuration is not already loaded, this function will trigger
@@ -69,17 +90,25 @@ def get(key: str, default: Any = None) -> Any:
     return get_config().get(key, default)
 
 
-def get_critique_refine_config() -> Dict[str, Any]:
+def _get_section(key: str) -> Mapping[str, Any]:
+    """Retrieve a top-level config section, caching it until the config is reloaded."""
+    section = _sections_cache.get(key)
+    if section is None:
+        section = _sections_cache[key] = get(key, {})
+    return section
+
+
+def get_critique_refine_config() -> Mapping[str, Any]:
     """Retrieve the critique_refine_config section."""
-    return get("critique_refine_config", {})
+    return _get_section("critique_refine_config")
 
 
-def get_logging_config() -> Dict[str, Any]:
+def get_logging_config() -> Mapping[str, Any]:
     """Retrieve the logging_config section."""
-    return get("logging_config", {})
+    return _get_section("logging_config")
 
 
-_strategies_config: Optional[Dict[str, Any]] = None
+_strategies_config: Optional[Mapping[str, Any]] = None
 _STRATEGIES_PATH = Path(__file__).parent.parent / "strategies.yaml"
 
 
@@ -92,7 +121,7 @@ def load_strategies_config(strategies_path: Path = _STRATEGIES_PATH) -> None:
         return
     try:
         with open(strategies_path, "r", encoding="utf-8") as f:
-            _strategies_config = yaml.safe_load(f)
+            _strategies_config = yaml.load(f, Loader=_YamlLoader) or {}
     except (yaml.YAMLError, IOError) as e:
         print(f"Warning: Could not load or parse strategies.yaml: {e}")
         _strategies_config = {}
@@ -111,33 +140,46 @@ def get_strategy_config(strategy_name: str) -> Optional[Dict[str, Any]]:
     return get_strategies_config_all().get(strategy_name)
 
 
+def reload_config() -> None:
+    """Discard the loaded configuration, strategies and cached role templates.
+
+    The next accessor call re-reads everything from disk.
+    """
+    # pylint: disable=global-statement
+    global _config, _strategies_config
+    _config = None
+    _strategies_config = None
+    _sections_cache.clear()
+    clear_template_cache()
+
+
 def get_project_context_path() -> Optional[Path]:
     """Retrieve the project context path from the configuration."""
     path_str = get("project_context_path")
     return Path(path_str) if path_str else None
 
 
-def get_model_config() -> Dict[str, Any]:
+def get_model_config() -> Mapping[str, Any]:
     """Retrieve the model configuration section."""
-    return get("models", {})
+    return _get_section("models")
 
 
-def get_roles_config() -> Dict[str, Any]:
+def get_roles_config() -> Mapping[str, Any]:
     """Retrieve the roles configuration section."""
-    return get("roles", {})
+    return _get_section("roles")
 
 
-def get_default_generation_config() -> Dict[str, Any]:
+def get_default_generation_config() -> Mapping[str, Any]:
     """Retrieve default generation config parameters."""
     return get_model_config().get("default_generation_config", {})
 
 
-def get_redaction_config() -> Dict[str, Any]:
+def get_redaction_config() -> Mapping[str, Any]:
     """Retrieve the redaction configuration section."""
-    return get("redaction_config", {})
+    return _get_section("redaction_config")
 
 
-def get_supported_models() -> Dict[str, Any]:
+def get_supported_models() -> Mapping[str, Any]:
     """Retrieve the supported models configuration."""
     return get_model_config().get("supported", {})
 
@@ -147,6 +189,11 @@ def get_gemini_api_key() -> Optional[str]:
     return os.getenv("GEMINI_API_KEY")
 
 
+def _expand_roles(roles: List[str]) -> List[str]:
+    """Map role names to their prompt file names, leaving names that already end in .txt as is."""
+    return [role if role.endswith(".txt") else f"{role}.txt" for role in roles]
+
+
 def prepare_run_environment(run_args: Dict[str, Any]) -> Dict[str, Any]:
     """Prepare the run configuration by merging base config, strategies, and CLI overrides.
 
@@ -159,90 +206,101 @@ def prepare_run_environment(run_args: Dict[str, Any]) -> Dict[str, Any]:
     Raises:
         ValueError: If a specified strategy or role template is not found.
     """
-    current_config = get_critique_refine_config().copy()
-    
-    # Set default roles from the critique_refine_config
     critique_refine_config = get_critique_refine_config()
-    current_config["default_critic_role_prompt_file"] = critique_refine_config.get("default_critic_role")
-    current_config["default_refiner_role_prompt_file"] = critique_refine_config.get("default_refiner_role")
+    multi_critic_roles = run_args.get("multi_critic_roles")
+
+    # Sources in increasing precedence: base config, strategy, CLI overrides.
+    # Each layer also names the keys it displaces, since a run uses either a
+    # single default critic or a multi-critic role list, never both.
+    layers: List[Tuple[Dict[str, Any], Tuple[str, ...]]] = [(
+        {
+            **critique_refine_config,
+            "default_critic_role_prompt_file": critique_refine_config.get("default_critic_role"),
+            "default_refiner_role_prompt_file": critique_refine_config.get("default_refiner_role"),
+        },
+        (),
+    )]
 
     strategy = run_args.get("strategy")
     if strategy:
-        import logging
-        logging.info("Applying strategy: %s", strategy)
+        logger.info("Applying strategy: %s", strategy)
         strategy_config = get_strategy_config(strategy)
         if not strategy_config:
             raise ValueError(f"Strategy '{strategy}' not found in strategies.yaml.")
 
+        strategy_roles = None
+        strategy_values: Dict[str, Any] = {}
         if isinstance(strategy_config, list):
             # Strategy is a simple list of roles (e.g., final_cleanup_deep)
-            current_config["multi_critic_roles"] = [
-                f"{role}.txt" for role in strategy_config
-            ]
-            current_config.pop("default_critic_role_prompt_file", None)
+            strategy_roles = strategy_config
         elif isinstance(strategy_config, dict):
-            # Strategy is a dictionary with configuration
-            if "roles" in strategy_config and isinstance(strategy_config["roles"], list):
-                current_config["multi_critic_roles"] = [
-                    f"{role}.txt" for role in strategy_config["roles"]
-                ]
-                current_config.pop("default_critic_role_prompt_file", None)
-            
-            # Handle specific refiner role if defined in strategy
-            if "default_refiner_role_prompt_file" in strategy_config:
-                current_config["default_refiner_role_prompt_file"] = strategy_config["default_refiner_role_prompt_file"]
-
-            # Update other config items from strategy (e.g., max_rounds, stop_threshold, models)
-            current_config.update(strategy_config)
-            # Remove roles key from current_config to avoid conflicts with multi_critic_roles
-            current_config.pop("roles", None)
+            # Strategy is a dictionary with configuration (e.g., roles, max_rounds, models)
+            if isinstance(strategy_config.get("roles"), list):
+                strategy_roles = strategy_config["roles"]
+            # The roles key is replaced by multi_critic_roles
+            strategy_values = {k: v for k, v in strategy_config.items() if k != "roles"}
+
+        # A CLI multi-critic list replaces the strategy's roles, so skip expanding them.
+        if strategy_roles is not None and not multi_critic_roles:
+            layers.append((
+                {"multi_critic_roles": _expand_roles(strategy_roles)},
+                ("default_critic_role_prompt_file",),
+            ))
+        layers.append((strategy_values, ()))
 
     critic_role = run_args.get("critic_role")
     if critic_role:
-        import logging
-        logging.info("Overriding critic role with CLI argument: %s", critic_role)
-        current_config["default_critic_role_prompt_file"] = critic_role
-        if "multi_critic_roles" in current_config:
-            logging.warning(
+        logger.info("Overriding critic role with CLI argument: %s", critic_role)
+        if any("multi_critic_roles" in values for values, _ in layers):
+            logger.warning(
                 "CLI argument --critic-role overrides multi-critic strategy."
             )
-            del current_config["multi_critic_roles"]
+        layers.append((
+            {"default_critic_role_prompt_file": critic_role},
+            ("multi_critic_roles",),
+        ))
 
     refiner_role = run_args.get("refiner_role")
     if refiner_role:
-        import logging
-        logging.info("Overriding refiner role with CLI argument: %s", refiner_role)
-        current_config["default_refiner_role_prompt_file"] = refiner_role
+        logger.info("Overriding refiner role with CLI argument: %s", refiner_role)
+        layers.append(({"default_refiner_role_prompt_file": refiner_role}, ()))
 
-    multi_critic_roles = run_args.get("multi_critic_roles")
     if multi_critic_roles:
-        current_config["multi_critic_roles"] = multi_critic_roles.split(",")
-        if "default_critic_role_prompt_file" in current_config:
-            del current_config["default_critic_role_prompt_file"]
+        layers.append((
+            {"multi_critic_roles": _expand_roles(multi_critic_roles.split(","))},
+            ("default_critic_role_prompt_file",),
+        ))
+
+    current_config: Dict[str, Any] = {}
+    for values, displaced in layers:
+        for key in displaced:
+            current_config.pop(key, None)
+        current_config.update(values)
 
-    # Load roles
-    roles = {}
     # Load roles from config, with fallbacks for safety
-    critique_refine_config = get_critique_refine_config()
     critic_role_file = current_config.get("default_critic_role_prompt_file") or critique_refine_config.get("default_critic_role", "critic.txt")
     refiner_role_file = current_config.get("default_refiner_role_prompt_file") or critique_refine_config.get("default_refiner_role", "refiner.txt")
 
+    role_files = {
+        "critic_template": critic_role_file,
+        "refiner_template": refiner_role_file,
+    }
+    # Also load meta-critic for the loop, if defined
+    meta_critic_role = critique_refine_config.get("meta_critic_role")
+    if meta_critic_role:
+        role_files["meta_critic_template"] = meta_critic_role
+
     try:
-        roles["critic_template"] = load_role_template(critic_role_file)
-        roles["refiner_template"] = load_role_template(refiner_role_file)
-        
-        # Also load meta-critic for the loop, if defined
-        meta_critic_role = critique_refine_config.get("meta_critic_role")
-        if meta_critic_role:
-            roles["meta_critic_template"] = load_role_template(meta_critic_role)
-            
+        # Load each distinct file once, even if several roles share it.
+        templates = {name: load_role_template(name) for name in dict.fromkeys(role_files.values())}
+        roles = {key: templates[name] for key, name in role_files.items()}
     except (TemplateNotFoundError, IOError) as e:
         raise ValueError(f"Error loading role template: {e}") from e
 
     return {"config": current_config, "roles": roles}
 
 
-def build_run_config(run_args: Dict[str, Any], full_config: Dict[str, Any]) -> RunConfig:
+def build_run_config(run_args: Dict[str, Any], full_config: Mapping[str, Any]) -> RunConfig:
     """Build a RunConfig object from command-line arguments and the full application config.
 
     Args:
@@ -0,0 +1,30 @@
+"""JSON encoding and decoding helpers shared by the logger, analyzer and viewer.
+
+orjson is used when it is installed; otherwise the stdlib json module
+produces equivalent output, only slower. orjson.JSONDecodeError subclasses
+json.JSONDecodeError, so callers catch the latter either way.
+"""
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+
+def _dump_json(data: Any) -> bytes:
+    """Serialize data as indented UTF-8 JSON, stringifying unsupported types."""
+    if orjson is not None:
+        return orjson.dumps(data, default=str, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2, default=str).encode("utf-8")
+
+
+def _dumps_line(data: Any) -> bytes:
+    """Serialize data as one compact UTF-8 JSON line, including the newline."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(data, separators=(",", ":")) + "\n").encode("utf-8")
@@ -1,8 +1,8 @@
-import json
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
-from .redact import _redact_dict_recursive
+from .jsonio import _dumps_line
+from .redact import _redact_dict_recursive, compile_redaction_patterns
 
 
 class Logger:
@@ -26,8 +26,14 @@ class Logger:
         self.log_file = Path(log_file_path)
         self.log_file.parent.mkdir(parents=True, exist_ok=True)
         self.redact = redact
-        self.keys_to_redact = keys_to_redact or []
-        self.redaction_patterns = redaction_patterns or []
+        self.keys_to_redact = frozenset(keys_to_redact or [])
+        # Patterns are only compiled when they will be used, so a bad pattern
+        # cannot break runs that do not redact.
+        self.redaction_patterns = (
+            compile_redaction_patterns(redaction_patterns or []) if redact else []
+        )
+        # With nothing to redact, entries are written as-is even when redaction is enabled.
+        self._has_redactions = bool(self.keys_to_redact or self.redaction_patterns)
 
     def log_run(self, log_entry: Dict[str, Any]):
         """Log a single run entry, redacting if configured.
@@ -41,9 +47,8 @@ class Logger:
                 keys_to_redact=self.keys_to_redact,
                 patterns=self.redaction_patterns,
             )
-            if self.redact
+            if self.redact and self._has_redactions
             else log_entry
         )
-
-        with open(self.log_file, "a", encoding="utf-8") as f:
-            f.write(json.dumps(entry_to_log) + "\n")
+        with open(self.log_file, "ab") as f:
+            f.write(_dumps_line(entry_to_log))
@@ -1,35 +1,62 @@
 import re
-import copy
-from typing import Any, List, Tuple
+from typing import Any, Callable, Collection, List, Match, Pattern, Tuple, Union
+
+Replacement = Union[str, Callable[[Match[str]], str]]
+
+
+def compile_redaction_patterns(
+    patterns: List[Tuple[str, str]],
+) -> List[Tuple[Pattern[str], Replacement]]:
+    """Compile (pattern, replacement) pairs once for repeated case-insensitive redaction.
+
+    When possible the patterns are merged into a single alternation, so each
+    string is scanned once and the branch that matched selects the
+    replacement. Patterns with their own groups or replacements containing
+    escapes (e.g. backreferences) are kept as separate substitutions, since
+    merging would renumber their groups.
+    """
+    compiled = [(re.compile(pattern, re.IGNORECASE), replacement) for pattern, replacement in patterns]
+    if len(compiled) < 2 or any(p.groups or "\\" in r for p, r in compiled):
+        return compiled
+    try:
+        combined = re.compile("|".join(f"({p.pattern})" for p, _ in compiled), re.IGNORECASE)
+    except re.error:
+        # e.g. a pattern with global inline flags, which must lead the expression.
+        return compiled
+    replacements = tuple(r for _, r in compiled)
+    return [(combined, lambda match: replacements[match.lastindex - 1])]
+
 
 def _redact_dict_recursive(
     data: Any,
-    keys_to_redact: List[str],
-    patterns: List[Tuple[str, str]],
+    keys_to_redact: Collection[str],
+    patterns: List[Tuple[Pattern[str], Replacement]],
 ) -> Any:
     """
     Recursively walks nested dictionaries and lists to redact sensitive data.
 
-    It redacts based on both sensitive keys and regex patterns.
-    Operates on a deep copy of the input data.
+    It redacts based on both sensitive keys and precompiled regex patterns
+    (see ``compile_redaction_patterns``).
+    Builds new dictionaries, lists and strings in a single pass; the input is
+    never modified, and values that need no redaction are shared by reference.
     """
-    # Deep copy to avoid modifying the original dictionary in place
-    data = copy.deepcopy(data)
-
     if isinstance(data, dict):
-        for key, value in data.items():
-            if key in keys_to_redact:
-                data[key] = f"[REDACTED_{key.upper()}]"
-            else:
-                data[key] = _redact_dict_recursive(value, keys_to_redact, patterns)
-    elif isinstance(data, list):
+        return {
+            key: (
+                f"[REDACTED_{key.upper()}]"
+                if key in keys_to_redact
+                else _redact_dict_recursive(value, keys_to_redact, patterns)
+            )
+            for key, value in data.items()
+        }
+    if isinstance(data, list):
         return [
             _redact_dict_recursive(item, keys_to_redact, patterns) for item in data
         ]
-    elif isinstance(data, str):
+    if isinstance(data, str):
         redacted_text = data
         for pattern, replacement in patterns:
-            redacted_text = re.sub(pattern, replacement, redacted_text, flags=re.IGNORECASE)
+            redacted_text = pattern.sub(replacement, redacted_text)
         return redacted_text
 
     return data
@@ -1,6 +1,15 @@
+import heapq
 import json
+import os
+from collections import Counter, deque
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Iterator, List, Optional
+
+from .jsonio import _json_loads
+
+# Bytes read from the end of a .jsonl log to find its newest entry without reading the whole file.
+_JSONL_TAIL_BYTES = 1 << 20
+
 
 class ReviewAnalyzer:
     """Analyzes past review logs to extract insights for self-improvement."""
@@ -11,38 +20,97 @@ class ReviewAnalyzer:
     def _load_log_file(self, file_path: Path) -> Optional[Dict[str, Any]]:
         """Loads a single JSON log file."""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            with open(file_path, 'rb') as f:
+                raw = f.read()
+            return _json_loads(raw)
         except (json.JSONDecodeError, FileNotFoundError):
             return None
 
+    def _iter_log_entries(self, file_path: Path) -> Iterator[Dict[str, Any]]:
+        """Yields the entries of a log file, oldest first.
+
+        .jsonl files are parsed one line at a time, skipping undecodable lines;
+        any other file is treated as a single JSON document.
+        """
+        if file_path.suffix != ".jsonl":
+            log_data = self._load_log_file(file_path)
+            if log_data:
+                yield log_data
+            return
+        try:
+            with open(file_path, 'rb') as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    try:
+                        yield _json_loads(line)
+                    except json.JSONDecodeError:
+                        continue
+        except FileNotFoundError:
+            return
+
+    def _load_latest_entry(self, file_path: Path) -> Optional[Dict[str, Any]]:
+        """Loads the newest entry of a log file.
+
+        For .jsonl files only the tail of the file is read, falling back to a
+        full scan if no complete entry fits in the tail window.
+        """
+        if file_path.suffix != ".jsonl":
+            return self._load_log_file(file_path)
+        try:
+            with open(file_path, 'rb') as f:
+                size = f.seek(0, os.SEEK_END)
+                start = max(0, size - _JSONL_TAIL_BYTES)
+                f.seek(start)
+                lines = f.read().splitlines()
+        except FileNotFoundError:
+            return None
+        if start > 0:
+            lines = lines[1:]  # The first line is likely cut off by the window.
+        for line in reversed(lines):
+            if not line.strip():
+                continue
+            try:
+                return _json_loads(line)
+            except json.JSONDecodeError:
+                continue
+        if start == 0:
+            return None
+        latest = deque(self._iter_log_entries(file_path), maxlen=1)
+        return latest[0] if latest else None
+
     def get_recent_insights(self, num_logs: int = 5) -> List[Dict[str, Any]]:
         """
         Retrieves and analyzes the most recent review logs.
 
         Returns a list of dictionaries, each containing a summary of a log.
+        Critiques and refinements are passed through as the log's own lists;
+        callers truncate them if they need short summaries.
         """
         insights = []
-        log_files = sorted(
-            self.log_directory.glob("log_of_*.json"),
-            key=lambda f: f.stat().st_mtime,
-            reverse=True
-        )
+        try:
+            with os.scandir(self.log_directory) as it:
+                entries = [
+                    (entry.stat().st_mtime, entry.path)
+                    for entry in it
+                    if entry.name.startswith("log_of_")
+                    and entry.name.endswith((".json", ".jsonl"))
+                    and entry.is_file()
+                ]
+        except FileNotFoundError:
+            entries = []
 
-        for log_file in log_files[:num_logs]:
-            log_data = self._load_log_file(log_file)
+        # Only the newest num_logs files are needed, so avoid sorting them all.
+        for _, log_path in heapq.nlargest(num_logs, entries):
+            log_data = self._load_latest_entry(Path(log_path))
             if log_data:
                 insight = {
                     "timestamp": log_data.get("timestamp"),
                     "original_user_prompt": log_data.get("original_user_prompt"),
                     "final_output_summary": log_data.get("final_output", "")[:200] + "...",  # Truncate for summary
                     "reason_for_stopping": log_data.get("reason_for_stopping"),
-                    "critiques_summary": [
-                        c.get("text", "")[:100] + "..." for c in log_data.get("critiques", [])
-                    ],
-                    "refinements_summary": [
-                        r.get("text", "")[:100] + "..." for r in log_data.get("refinements", [])
-                    ],
+                    "critiques": log_data.get("critiques", []),
+                    "refinements": log_data.get("refinements", []),
                     "config_used": log_data.get("config_used"),
                 }
                 insights.append(insight)
@@ -60,27 +128,20 @@ class ReviewAnalyzer:
             return "No past review logs found for analysis."
 
         # Example: Look for common reasons for stopping
-        stop_reasons_count = {}
-        for insight in insights:
-            reason = insight.get("reason_for_stopping")
-            if reason:
-                stop_reasons_count[reason] = stop_reasons_count.get(reason, 0) + 1
-        
-        most_common_stop_reason = None
+        stop_reasons_count = Counter(
+            reason for reason in (insight.get("reason_for_stopping") for insight in insights) if reason
+        )
+
         if stop_reasons_count:
-            # Ensure the key is callable for max function
-            most_common_stop_reason = max(stop_reasons_count, key=lambda k: stop_reasons_count.get(k, 0))
+            most_common_stop_reason = stop_reasons_count.most_common(1)[0][0]
             suggestions.append(f"- The most common reason for stopping in recent runs was: '{most_common_stop_reason}'. Consider ways to address this, e.g., by adjusting `max_rounds` or `stop_threshold`, or improving relevant role prompts.")
 
         # Example: Look for short critiques (might indicate lack of detail)
-        short_critiques_found = False
-        for insight in insights:
-            for critique_summary in insight.get("critiques_summary", []):
-                if len(critique_summary) < 50:  # Arbitrary threshold for "short"
-                    short_critiques_found = True
-                    break
-            if short_critiques_found:
-                break
+        short_critiques_found = any(
+            len(critique.get("text", "")) < 50  # Arbitrary threshold for "short"
+            for insight in insights
+            for critique in insight.get("critiques", [])
+        )
         if short_critiques_found:
             suggestions.append("- Some critiques appear to be very short. Review the 'meta_critic' prompt or critic role prompts to encourage more detailed and actionable feedback.")
 
@@ -1,49 +1,92 @@
 import streamlit as st
 import json
-import glob
 import os
+from itertools import islice
 from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from utils.jsonio import _json_loads
+
+# Number of .jsonl entries parsed and rendered per page.
+ENTRIES_PER_PAGE = 10
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def _count_log_entries(path: str, mtime: float) -> int:
+    """Counts the entries (lines) of a .jsonl log; mtime is part of the cache key."""
+    with open(path, 'rb') as f:
+        return sum(1 for _ in f)
+
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def _load_log(
+    path: str, mtime: float, start: int = 0, stop: Optional[int] = None
+) -> List[Tuple[int, Optional[Dict[str, Any]], str]]:
+    """Parses a log file, caching the result until the file's mtime changes.
+
+    For .jsonl files only lines start..stop are parsed; each result is
+    (line index, entry or None if undecodable, raw line text for errors).
+    A .json file yields its single entry, and invalid JSON raises.
+    """
+    with open(path, 'rb') as f:
+        if Path(path).suffix != ".jsonl":
+            return [(0, _json_loads(f.read()), "")]
+        entries = []
+        for line_num, line in enumerate(islice(f, start, stop), start):
+            try:
+                entries.append((line_num, _json_loads(line), ""))
+            except json.JSONDecodeError:
+                entries.append((line_num, None, line.decode('utf-8', 'replace').strip()))
+        return entries
+
 
 def display_run_log(log_data):
-    """Displays a single structured run log."""
+    """Displays a single structured run log.
+
+    Each section is rendered with as few Streamlit elements as possible, since
+    every element call costs a round-trip to the frontend.
+    """
     st.subheader("Run Log Details")
-    
-    st.markdown(f"**Timestamp:** {log_data.get('timestamp', 'N/A')}")
-    st.markdown(f"**Original User Prompt:** {log_data.get('original_user_prompt', 'N/A')}")
-    st.markdown(f"**Reason for Stopping:** {log_data.get('reason_for_stopping', 'N/A')}")
-    st.markdown(f"**Runtime:** {log_data.get('runtime', 'N/A'):.2f} seconds" if isinstance(log_data.get('runtime'), (int, float)) else f"**Runtime:** {log_data.get('runtime', 'N/A')}")
-
-    st.markdown("---")
-    st.markdown("#### Initial Generation")
+
+    runtime = log_data.get('runtime', 'N/A')
+    runtime_text = f"{runtime:.2f} seconds" if isinstance(runtime, (int, float)) else runtime
+    st.markdown(
+        f"**Timestamp:** {log_data.get('timestamp', 'N/A')}\n\n"
+        f"**Original User Prompt:** {log_data.get('original_user_prompt', 'N/A')}\n\n"
+        f"**Reason for Stopping:** {log_data.get('reason_for_stopping', 'N/A')}\n\n"
+        f"**Runtime:** {runtime_text}\n\n"
+        "---\n\n#### Initial Generation"
+    )
     st.code(log_data.get('initial_generation', {}).get('text', 'N/A'), language='text')
 
-    st.markdown("---")
-    st.markdown("#### Critiques")
-    if log_data.get('critiques'):
-        for i, critique in enumerate(log_data['critiques']):
-            st.markdown(f"##### Round {critique.get('round', i+1)}")
-            st.markdown(f"**Model Used:** {critique.get('model_used', 'N/A')}")
-            st.markdown(f"**Roles Used:** {', '.join(critique.get('role_prompt_file_used', ['N/A']))}")
-            st.code(critique.get('text', 'N/A'), language='text')
+    st.markdown("---\n\n#### Critiques")
+    critiques = log_data.get('critiques')
+    if critiques:
+        st.markdown("\n\n".join(
+            f"##### Round {critique.get('round', i+1)}\n"
+            f"**Model Used:** {critique.get('model_used', 'N/A')}  \n"
+            f"**Roles Used:** {', '.join(critique.get('role_prompt_file_used', ['N/A']))}"
+            for i, critique in enumerate(critiques)
+        ))
+        st.code("\n\n---\n\n".join(critique.get('text', 'N/A') for critique in critiques), language='text')
     else:
         st.info("No critiques found for this run.")
 
-    st.markdown("---")
-    st.markdown("#### Refinements")
-    if log_data.get('refinements'):
-        for i, refinement in enumerate(log_data['refinements']):
-            st.markdown(f"##### Round {refinement.get('round', i+1)}")
-            st.markdown(f"**Model Used:** {refinement.get('model_used', 'N/A')}")
-            st.code(refinement.get('text', 'N/A'), language='text')
+    st.markdown("---\n\n#### Refinements")
+    refinements = log_data.get('refinements')
+    if refinements:
+        st.markdown("\n\n".join(
+            f"##### Round {refinement.get('round', i+1)}\n"
+            f"**Model Used:** {refinement.get('model_used', 'N/A')}"
+            for i, refinement in enumerate(refinements)
+        ))
+        st.code("\n\n---\n\n".join(refinement.get('text', 'N/A') for refinement in refinements), language='text')
     else:
         st.info("No refinements found for this run.")
-    
-    st.markdown("---")
-    st.markdown("#### Final Output")
+
+    st.markdown("---\n\n#### Final Output")
     st.code(log_data.get('final_output', 'N/A'), language='text')
 
-    st.markdown("---")
-    st.markdown("#### Configuration Used")
+    st.markdown("---\n\n#### Configuration Used")
     st.json(log_data.get('config_used', {}))
 
 
@@ -51,17 +94,24 @@ st.title("CritiqueRefineTool Log Viewer")
 
 # Define log directories
 log_dirs = ["logs", "reviews/self-improve"]
-all_log_files = []
+log_file_entries = []
 
 for log_dir in log_dirs:
     if not os.path.exists(log_dir):
         st.warning(f"Log directory '{log_dir}' not found.")
     else:
         # Collect .jsonl files (for main runs) and .json files (for self-review runs)
-        all_log_files.extend(glob.glob(os.path.join(log_dir, "*.jsonl")))
-        all_log_files.extend(glob.glob(os.path.join(log_dir, "*.json")))
+        with os.scandir(log_dir) as it:
+            log_file_entries.extend(
+                (entry.stat().st_mtime, entry.path)
+                for entry in it
+                if entry.name.endswith((".jsonl", ".json"))
+                and not entry.name.startswith(".")
+                and entry.is_file()
+            )
 
-all_log_files.sort(key=os.path.getmtime, reverse=True) # Sort by modification time, newest first
+log_file_entries.sort(reverse=True) # Sort by modification time, newest first
+all_log_files = [path for _, path in log_file_entries]
 
 if all_log_files:
     selected_file_path = st.selectbox("Select a log file:", all_log_files)
@@ -72,19 +122,26 @@ if all_log_files:
             file_extension = Path(selected_file_path).suffix
             
             if file_extension == ".jsonl":
-                with open(selected_file_path, 'r', encoding='utf-8') as f:
-                    for line_num, line in enumerate(f):
-                        try:
-                            log_entry = json.loads(line)
-                            st.markdown(f"### Log Entry {line_num + 1}")
-                            display_run_log(log_entry)
-                            st.markdown("---") # Separator between multiple logs in a .jsonl file
-                        except json.JSONDecodeError:
-                            st.warning(f"Error decoding JSON from line {line_num + 1} in {selected_file_path}: {line.strip()}")
-            elif file_extension == ".json":
-                with open(selected_file_path, 'r', encoding='utf-8') as f:
-                    log_entry = json.load(f)
+                # Count entries first so only the lines on the selected page are parsed.
+                mtime = os.path.getmtime(selected_file_path)
+                total_entries = _count_log_entries(selected_file_path, mtime)
+                num_pages = max(1, -(-total_entries // ENTRIES_PER_PAGE))
+                page = st.number_input(
+                    f"Page (1-{num_pages}, {total_entries} entries):",
+                    min_value=1, max_value=num_pages, value=1, step=1,
+                )
+                start = (int(page) - 1) * ENTRIES_PER_PAGE
+                page_entries = _load_log(selected_file_path, mtime, start, start + ENTRIES_PER_PAGE)
+                for line_num, log_entry, raw_line in page_entries:
+                    if log_entry is None:
+                        st.warning(f"Error decoding JSON from line {line_num + 1} in {selected_file_path}: {raw_line}")
+                        continue
+                    st.markdown(f"### Log Entry {line_num + 1}")
                     display_run_log(log_entry)
+                    st.markdown("---") # Separator between multiple logs in a .jsonl file
+            elif file_extension == ".json":
+                log_entry = _load_log(selected_file_path, os.path.getmtime(selected_file_path))[0][1]
+                display_run_log(log_entry)
             else:
                 st.error(f"Unsupported file type: {file_extension}")
 